@@ -5,7 +5,7 @@ __author__  = "ChenyangGao <https://chenyanggao.github.io/>"
 
 import sys
 
-if sys.version_info < (3, 10):
+if __debug__ and sys.version_info < (3, 10):
     msg = f"""\
 Python version at least 3.10, got
     * executable: {sys.executable!r}
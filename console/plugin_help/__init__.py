@@ -1,11 +1,59 @@
 #!/usr/bin/env python3
 # coding: utf-8
 
-from plugin_util.pip_tool import pip_install as install, pip_uninstall as uninstall, ensure_import
+from importlib import import_module
+from typing import Final, Mapping, Optional
 
-from . import editor
-from .console import *
-from .function import *
+__all__ = [
+    "SETTINGS", "set_settings", 
+    "CONSOLE_MAP", "CONSOLE_MAP_RO", "register_console", "start_console",
+    "astart_console", "warm_console_caches", "start_embedded_python_shell",
+    "abort", "exit", "dump_wrapper", "load_wrapper", "get_container",
+    "run_env", "load_script", "run_plugin",
+    "install", "uninstall", "ensure_import", "editor",
+]
 
-__all__ = console.__all__ + function.__all__ + ["install", "uninstall", "ensure_import", "editor"]
+# These attributes will not be imported until they are first accessed (PEP 562),
+# mapping of attribute name to (module name, attribute name in module or None)
+_LAZY_ATTRS: Final[dict[str, tuple[str, Optional[str]]]] = {
+    "editor": (".editor", None),
+    "console": (".console", None),
+    "function": (".function", None),
+    "install": ("plugin_util.pip_tool", "pip_install"),
+    "uninstall": ("plugin_util.pip_tool", "pip_uninstall"),
+    "ensure_import": ("plugin_util.pip_tool", "ensure_import"),
+    **{name: (".console", name) for name in (
+        "CONSOLE_MAP", "CONSOLE_MAP_RO", "register_console", "start_console",
+        "astart_console", "warm_console_caches", "start_embedded_python_shell",
+    )},
+    **{name: (".function", name) for name in (
+        "abort", "exit", "dump_wrapper", "load_wrapper", "get_container",
+        "run_env", "load_script", "run_plugin",
+    )},
+}
 
+# The settings of the current session (with keys "config", "path", "env"), 
+# set by the startup file, None if the environment has not been loaded
+SETTINGS: Optional[Mapping] = None
+
+
+def set_settings(settings: Optional[Mapping], /) -> None:
+    "Set the settings of the current session, None means to unload them."
+    global SETTINGS
+    SETTINGS = settings
+
+
+def __getattr__(name: str):
+    try:
+        module, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _LAZY_ATTRS.keys())
@@ -3,53 +3,172 @@
 
 __author__  = "ChenyangGao <https://chenyanggao.github.io/>"
 __version__ = (0, 0, 1)
-__all__ = ["CONSOLE_MAP", "register_console", "start_console", "start_embedded_python_shell"]
-
-from os import environ, path as os_path
-from subprocess import CompletedProcess
-from sys import _getframe, executable
+__all__ = [
+    "CONSOLE_MAP", "CONSOLE_MAP_RO", "register_console", "start_console", 
+    "astart_console", "warm_console_caches", "start_embedded_python_shell", 
+]
+
+from functools import partial
+from importlib.util import find_spec
+from os import close, environ, open as os_open, write, O_CREAT, O_EXCL, O_WRONLY
+from subprocess import CompletedProcess, DEVNULL, Popen
+from threading import Thread
+from sys import _getframe, executable, intern, modules, platform
+from types import MappingProxyType
 from typing import Callable, Final, Optional
 
-from plugin_util.console import start_specific_python_console
-from plugin_util.pip_tool import ensure_install
+from plugin_util.lazy import lazy_import
 from plugin_util.register import bind_function_registry
-from plugin_util.run import prun, prun_module, restart_program
 
 
-_SYSTEM_IS_WINDOWS: Final[bool] = __import__("platform").system() == "Windows"
-CONSOLE_MAP: Final[dict[str, Callable]] = {}
+# NOTE: Only one console will be started in a process, 
+#       so these modules are imported until they are needed.
+start_specific_python_console = lazy_import("plugin_util.console", "start_specific_python_console")
+ensure_install = lazy_import("plugin_util.pip_tool", "ensure_install")
+prun = lazy_import("plugin_util.run", "prun")
+prun_module = lazy_import("plugin_util.run", "prun_module")
+aprun_module = lazy_import("plugin_util.run", "aprun_module")
+gather = lazy_import("asyncio", "gather")
+to_thread = lazy_import("asyncio", "to_thread")
+_ctx_wrapper = lazy_import(".function", "_ctx_wrapper", package=__package__)
+BookContainer = lazy_import("bookcontainer", "BookContainer")
 
 
-register_console = bind_function_registry(CONSOLE_MAP)
-register_console.__doc__ = """\
-Register a console with a specified name.
+_SYSTEM_IS_WINDOWS: Final[bool] = platform == "win32"
+# NOTE: Use `register_console` to add consoles, other mutations are discouraged
+CONSOLE_MAP: Final[dict[str, Callable]] = {}
+# A read-only view of `CONSOLE_MAP`
+CONSOLE_MAP_RO: Final[MappingProxyType[str, Callable]] = MappingProxyType(CONSOLE_MAP)
+# Names of registered consoles, updated by `register_console`
+_CONSOLE_NAMES: tuple[str, ...] = ()
+# Mapping of console name to the heavy module that its process will import, 
+# used by `warm_console_caches`
+_WARM_CACHE_MODULES: Final[dict[str, str]] = {
+    "ipython": "IPython", 
+    "ptpython": "ptpython.repl", 
+    "ptipython": "ptpython.ipython", 
+    "jupyter console": "jupyter_console.app", 
+}
+_WARM_CACHE_PROCS: Final[dict[str, Popen]] = {}
+_NOTEBOOK_FILE: Final[str] = "sigil_console.ipynb"
+_EMPTY_NOTEBOOK: Final[bytes] = b'{"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}'
+# The exit code of a console process, which is terminated by an uncaught `ImportError`
+_EXIT_IMPORT_ERROR: Final[int] = 99
+# Run the module `sys.argv[1]` as a script (like `python -m`), but exit with 
+# `_EXIT_IMPORT_ERROR` on an uncaught `ImportError`. NOTE: It is kept in one line 
+# and free of the special characters of cmd.exe, since `prun_module` uses a shell on Windows.
+_RUN_MODULE_SOURCE: Final[str] = (
+    "import os,runpy,sys;h=sys.excepthook;"
+    "sys.excepthook=lambda t,v,b:(h(t,v,b),issubclass(t,ImportError) "
+    f"and (sys.stderr.flush(),os._exit({_EXIT_IMPORT_ERROR})));"
+    "runpy.run_module(sys.argv.pop(1),run_name='__main__',alter_sys=True)"
+)
+
+
+_register = bind_function_registry(CONSOLE_MAP)
+
+
+def register_console(
+    func_or_key: str | Callable, 
+    /, 
+    key: Optional[str] = None, 
+):
+    """Register a console with a specified name.
 
-You can register a function with the name `"console_name"` through these ways
+    You can register a function with the name `"console_name"` through these ways
 
-.. code-block:: python
+    .. code-block:: python
 
-    @register_console("console_name")
-    def start_specific_console():
-        ...
+        @register_console("console_name")
+        def start_specific_console():
+            ...
 
-**OR**
+    **OR**
 
-.. code-block:: python
+    .. code-block:: python
 
-    @register_console
-    def console_name():
-        ...
+        @register_console
+        def console_name():
+            ...
 
-"""
+    """
+    global _CONSOLE_NAMES
+    if not callable(func_or_key):
+        return partial(register_console, key=func_or_key)
+    _register(func_or_key, key=None if key is None else intern(key))
+    _CONSOLE_NAMES = tuple(CONSOLE_MAP)
+    return func_or_key
+
+
+def _install_missing(requires: tuple[tuple[str, ...], ...], /) -> bool:
+    """Install the missing modules of `requires` (each item is the arguments 
+    of `ensure_install`, the module name goes first and then the name on PyPI), 
+    return whether any module has been installed."""
+    missing = [require for require in requires if find_spec(require[0]) is None]
+    for require in missing:
+        ensure_install(*require)
+    return bool(missing)
+
+
+def _ensure_notebook() -> None:
+    "Create an empty notebook file, if it does not exist."
+    try:
+        fd = os_open(_NOTEBOOK_FILE, O_WRONLY | O_CREAT | O_EXCL)
+    except FileExistsError:
+        return
+    try:
+        write(fd, _EMPTY_NOTEBOOK)
+    finally:
+        close(fd)
 
 
 def start_console(name: str, /):
     "Run a console with a specified name."
+    start = CONSOLE_MAP.get(intern(name))
+    if start is None:
+        raise ValueError(f"no such console: {name!r}, only accept: {_CONSOLE_NAMES!r}")
+    start()
+
+
+async def astart_console(name: str, /):
+    """Run a console with a specified name asynchronously. 
+    If the console is started in a child process, the process will be awaited, 
+    otherwise (e.g., the embedded shells) it just runs in the current thread.
+    """
+    start = CONSOLE_MAP.get(intern(name))
+    if start is None:
+        raise ValueError(f"no such console: {name!r}, only accept: {_CONSOLE_NAMES!r}")
+    astart = getattr(start, "astart", None)
+    if astart is None:
+        return start()
+    return await astart()
+
+
+def warm_console_caches(name: str, /) -> Optional[Popen]:
+    """Import the heavy modules of a console in a throwaway background process, 
+    so that the bytecode caches and the file system caches are warm when the console 
+    is actually started. Return the process, or None if the console has no heavy 
+    modules to import.
+
+    NOTE: This does not pre-start the console. The console needs the terminal (a tty), 
+    so `start_console` always starts a fresh process, and the process started here 
+    just exits after importing. Only the cost of loading the modules from disk is saved.
+    """
     try:
-        start = CONSOLE_MAP[name]
+        module = _WARM_CACHE_MODULES[name]
     except KeyError:
-        raise ValueError(f"no such console: {name!r}, only accept: {tuple(CONSOLE_MAP)!r}")
-    start()
+        return None
+    proc = _WARM_CACHE_PROCS.get(name)
+    if proc is None or proc.poll() is not None:
+        try:
+            proc = _WARM_CACHE_PROCS[name] = Popen(
+                [executable, "-c", f"import {module}"], 
+                stdin=DEVNULL, stdout=DEVNULL, stderr=DEVNULL, 
+                creationflags=0x08000000 if _SYSTEM_IS_WINDOWS else 0, # CREATE_NO_WINDOW
+            )
+        except OSError:
+            return None
+    return proc
 
 
 def start_embedded_python_shell(
@@ -59,287 +178,253 @@ def start_embedded_python_shell(
 ):
     "Start the specified embedded Python shell."
     if namespace is None:
-        frame = _getframe(1)
-        namespace = frame.f_locals
-        while namespace.get("__name__") != "__main__" and frame.f_back:
-            frame = frame.f_back
+        namespace = getattr(modules.get("__main__"), "__dict__", None)
+        if namespace is None or namespace.get("__name__") != "__main__":
+            frame = _getframe(1)
             namespace = frame.f_locals
-    if namespace is None:
-        namespace = {}
+            while namespace.get("__name__") != "__main__" and frame.f_back:
+                frame = frame.f_back
+                namespace = frame.f_locals
     if "plugin" not in namespace:
         import plugin_help as plugin
-        bc = __import__("bookcontainer").BookContainer(plugin.Wrapper)
+        bc = BookContainer(plugin.WRAPPER)
         namespace.update({"bc": bc, "bk": bc, "plugin": plugin, "editor": plugin.editor})
     start_specific_python_console(namespace, banner, shell)
 
 
-@register_console("python(embed)")
 def start_embedded_python():
     start_embedded_python_shell("python")
 
 
-@register_console("ipython(embed)")
 def start_embedded_ipython():
     start_embedded_python_shell("ipython")
 
 
-@register_console("bpython(embed)")
 def start_embedded_bpython():
     start_embedded_python_shell("bpython")
 
 
-@register_console("ptpython(embed)")
 def start_embedded_ptpython():
     start_embedded_python_shell("ptpython")
 
 
-@register_console("ptipython(embed)")
 def start_embedded_ptipython():
     start_embedded_python_shell("ptipython")
 
 
-@register_console("python")
 def start_python() -> CompletedProcess:
     """Start an python process, and wait until it is terminated.
     Reference:
         - https://www.python.org
         - https://docs.python.org/3/
     """
-    from .function import _ctx_wrapper
     with _ctx_wrapper():
         return prun(executable)
 
 
-@register_console("ipython")
-def start_ipython() -> CompletedProcess:
-    """Start an ipython process, and wait until it is terminated.
-    Reference:
-        - https://ipython.org
-        - https://ipython.org/documentation.html
-        - https://pypi.org/project/ipython/
-        - https://github.com/ipython/ipython
-    """
-    ensure_install("IPython", "ipython")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("IPython")
-
-
-@register_console("bpython")
-def start_bpython() -> CompletedProcess:
-    """Start an bpython process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/bpython/
-        - https://bpython-interpreter.org
-        - https://docs.bpython-interpreter.org/en/latest/
-    """
-    ensure_install("bpython")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("bpython")
-
-
-@register_console("ptpython")
-def start_ptpython() -> CompletedProcess:
-    """Start an ptpython process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/ptpython/
-        - https://github.com/prompt-toolkit/ptpython
-        - https://pypi.org/project/prompt-toolkit/
-        - https://www.asmeurer.com/mypython/
-    """
-    ensure_install("ptpython")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("ptpython")
-
-
-@register_console("ptipython")
-def start_ptipython() -> CompletedProcess:
-    """Start an ptipython process, and wait until it is terminated.
-    Reference:
-        - https://github.com/prompt-toolkit/ptpython#ipython-support
-    """
-    ensure_install("IPython", "ipython")
-    ensure_install("ptpython")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("ptpython.entry_points.run_ptipython")
-
-
-@register_console("xonsh")
-def start_xonsh() -> CompletedProcess:
-    """Start a xonsh process, and wait until it is terminated.
-    Reference:
-        - https://github.com/xonsh/xonsh
-        - https://xon.sh/contents.html
-    """
-    ensure_install("xonsh")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("xonsh", ("--rc", environ["PYTHONSTARTUP"]))
-
-
-@register_console("jupyter console")
-def start_jupyter_console() -> CompletedProcess:
-    """Start a jupyter console process, and wait until it is terminated.
-    Reference:
-        - https://jupyter-console.readthedocs.io/en/latest/
-    """
-    ensure_install("jupyter_console")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("jupyter_console")
-
-
-@register_console("jupyter lab")
-def start_jupyter_lab() -> CompletedProcess:
-    """Start a jupyter lab process, and wait until it is terminated.
-    Reference:
-        - https://jupyterlab.readthedocs.io/en/latest/
-    """
-    ensure_install("jupyterlab")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        if not os_path.exists("sigil_console.ipynb"):
-            open("sigil_console.ipynb", "w", encoding="utf-8").write(
-                '{"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}')
-        return prun_module("jupyterlab", ("--notebook-dir='.'", "--ServerApp.open_browser=True", "-y", "sigil_console.ipynb"))
-
-
-@register_console("jupyter notebook")
-def start_jupyter_notebook() -> CompletedProcess:
-    """Start a jupyter notebook process, and wait until it is terminated.
-    Reference:
-        - https://jupyter-notebook.readthedocs.io/en/latest/
-    """
-    ensure_install("notebook")
-    from .function import _ctx_wrapper
+async def _astart_python() -> CompletedProcess:
     with _ctx_wrapper():
-        if not os_path.exists("sigil_console.ipynb"):
-            open("sigil_console.ipynb", "w", encoding="utf-8").write(
-                '{"cells": [], "metadata": {}, "nbformat": 4, "nbformat_minor": 5}')
-        return prun_module("notebook", ("--NotebookApp.notebook_dir='.'", "--NotebookApp.open_browser=True", "-y", "sigil_console.ipynb"))
-
-
-@register_console("euporie console")
-def start_euporie_console() -> CompletedProcess:
-    """Start an euporie process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/euporie/
-        - https://euporie.readthedocs.io/en/latest/apps/console.html
+        return await aprun_module()
+
+start_python.astart = _astart_python # type: ignore
+
+
+def _make_console_starter(
+    name: str, 
+    module: str, 
+    args: tuple[str, ...] | Callable[[], tuple[str, ...]] = (), 
+    requires: tuple[tuple[str, ...], ...] = (), 
+    prepare: Optional[Callable[[], None]] = None, 
+    references: tuple[str, ...] = (), 
+) -> Callable[[], CompletedProcess]:
+    """Make a function that starts a console process by running `module` 
+    as a script, and waits until it is terminated. Its asynchronous version 
+    is set as the attribute `astart` of it.
+
+    :param name: The name of console.
+    :param module: The module to be run as a script.
+    :param args: The command line arguments, or a function which returns them 
+        (for the arguments which can only be determined at the time of calling).
+    :param requires: Each item is the arguments of `ensure_install`. They are 
+        only checked after the process is terminated by an uncaught `ImportError`, 
+        if any of them is missing, it will be installed and the process will be 
+        started again.
+    :param prepare: Will be called in a background thread, while the process is 
+        starting. NOTE: The process should not depend on it in its startup.
+    :param references: The documentation links, only used in the docstring.
     """
-    ensure_install("euporie")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("euporie.core", ("console",))
-
-
-@register_console("euporie notebook")
-def start_euporie_notebook() -> CompletedProcess:
-    """Start an euporie process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/euporie/
-        - https://euporie.readthedocs.io/en/latest/apps/notebook.html
-    """
-    ensure_install("euporie")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("euporie.core", ("notebook", "sigil_console.ipynb"))
-
-
-# @register_console("jpterm")
-# def start_jpterm() -> CompletedProcess:
-#     """Start a jpterm process, and wait until it is terminated.
-#     Reference:
-#         - https://pypi.org/project/jpterm/
-#     """
-#     ensure_install("jpterm")
-#     from .function import _ctx_wrapper
-#     with _ctx_wrapper():
-#         return prun([executable, "-c", "from jpterm.cli import main; main()"])
-
-
-@register_console("qtconsole")
-def start_qtconsole() -> CompletedProcess:
-    """Start a qtconsole process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/qtconsole/
-    """
-    ensure_install("qtconsole")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("qtconsole")
-
-
-@register_console("spyder")
-def start_spyder() -> CompletedProcess:
-    """Start a spyder IDE process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/spyder/
-    """
-    ensure_install("spyder")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("spyder.app.start", ("--window-title", "Sigil Console", "--workdir", environ["PLUGIN_OUTDIR"]))
-
-
-@register_console("idle")
-def start_idle() -> CompletedProcess:
-    """Start an idle process, and wait until it is terminated.
-    Reference:
-        - https://docs.python.org/3/library/idle.html
-        - 
-    """
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("idlelib", ("-t", "Sigil Console", "-s"))
-
-
-@register_console("idlex")
-def start_idlex() -> CompletedProcess:
-    """Start an idlex process, and wait until it is terminated.
-    Reference:
-        - https://idlex.sourceforge.net
-    """
-    ensure_install("idlexlib")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("idlexlib.launch", ("-t", "Sigil Console", "-r", environ["PYTHONSTARTUP"]))
-
-
-@register_console("idlea")
-def start_idlea() -> CompletedProcess:
-    """Start an idlea process, and wait until it is terminated.
-    Reference:
-        - https://pypi.org/project/idlea/
-    """
-    ensure_install("idlea")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("idlealib", ("-t", "Sigil Console", "-r", environ["PYTHONSTARTUP"]))
-
-
-@register_console("thonny")
-def start_thonny() -> CompletedProcess:
-    """Start a thonny IDE process, and wait until it is terminated.
-    Reference:
-        - https://thonny.org
-    """
-    ensure_install("thonny")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("thonny", (environ["PYTHONSTARTUP"],))
-
-
-@register_console("eric")
-def start_eric() -> CompletedProcess:
-    """Start an eric IDE process, and wait until it is terminated.
-    Reference:
-        - https://eric-ide.python-projects.org
-    """
-    ensure_install("eric-ide")
-    from .function import _ctx_wrapper
-    with _ctx_wrapper():
-        return prun_module("eric7.eric7_ide", (environ["PYTHONSTARTUP"],))
-
+    def start() -> CompletedProcess:
+        with _ctx_wrapper():
+            argv = ("-c", _RUN_MODULE_SOURCE, module, *(args() if callable(args) else args))
+            if prepare is None:
+                ret = prun_module(None, argv)
+            else:
+                preparing = Thread(target=prepare, daemon=True)
+                preparing.start()
+                ret = prun_module(None, argv)
+                preparing.join()
+            if ret.returncode == _EXIT_IMPORT_ERROR and _install_missing(requires):
+                ret = prun_module(None, argv)
+            return ret
+
+    async def astart() -> CompletedProcess:
+        with _ctx_wrapper():
+            argv = ("-c", _RUN_MODULE_SOURCE, module, *(args() if callable(args) else args))
+            if prepare is None:
+                ret = await aprun_module(None, argv)
+            else:
+                _, ret = await gather(to_thread(prepare), aprun_module(None, argv))
+            if ret.returncode == _EXIT_IMPORT_ERROR and _install_missing(requires):
+                ret = await aprun_module(None, argv)
+            return ret
+
+    start.__name__ = start.__qualname__ = "start_" + name.replace(" ", "_")
+    astart.__name__ = astart.__qualname__ = "a" + start.__name__
+    start.astart = astart # type: ignore
+    start.__doc__ = f"Start a {name} process, and wait until it is terminated."
+    if references:
+        start.__doc__ += "\n    Reference:\n" + "".join(f"        - {ref}\n" for ref in references)
+    return start
+
+
+_IDLE_ARGS: Final[tuple[str, ...]] = ("-t", "Sigil Console")
+_SPYDER_ARGS: Final[tuple[str, ...]] = ("--window-title", "Sigil Console", "--workdir")
+
+_CONSOLE_SPECS: Final[tuple[dict, ...]] = (
+    dict(
+        name="ipython", module="IPython", 
+        requires=(("IPython", "ipython"),), 
+        references=(
+            "https://ipython.org", 
+            "https://ipython.org/documentation.html", 
+            "https://pypi.org/project/ipython/", 
+            "https://github.com/ipython/ipython", 
+        ), 
+    ), 
+    dict(
+        name="bpython", module="bpython", 
+        requires=(("bpython",),), 
+        references=(
+            "https://pypi.org/project/bpython/", 
+            "https://bpython-interpreter.org", 
+            "https://docs.bpython-interpreter.org/en/latest/", 
+        ), 
+    ), 
+    dict(
+        name="ptpython", module="ptpython", 
+        requires=(("ptpython",),), 
+        references=(
+            "https://pypi.org/project/ptpython/", 
+            "https://github.com/prompt-toolkit/ptpython", 
+            "https://pypi.org/project/prompt-toolkit/", 
+            "https://www.asmeurer.com/mypython/", 
+        ), 
+    ), 
+    dict(
+        name="ptipython", module="ptpython.entry_points.run_ptipython", 
+        requires=(("IPython", "ipython"), ("ptpython",)), 
+        references=("https://github.com/prompt-toolkit/ptpython#ipython-support",), 
+    ), 
+    dict(
+        name="xonsh", module="xonsh", 
+        args=lambda: ("--rc", environ["PYTHONSTARTUP"]), 
+        requires=(("xonsh",),), 
+        references=(
+            "https://github.com/xonsh/xonsh", 
+            "https://xon.sh/contents.html", 
+        ), 
+    ), 
+    dict(
+        name="jupyter console", module="jupyter_console", 
+        requires=(("jupyter_console",),), 
+        references=("https://jupyter-console.readthedocs.io/en/latest/",), 
+    ), 
+    dict(
+        name="jupyter lab", module="jupyterlab", 
+        args=("--notebook-dir='.'", "--ServerApp.open_browser=True", "-y", _NOTEBOOK_FILE), 
+        requires=(("jupyterlab",),), 
+        prepare=_ensure_notebook, 
+        references=("https://jupyterlab.readthedocs.io/en/latest/",), 
+    ), 
+    dict(
+        name="jupyter notebook", module="notebook", 
+        args=("--NotebookApp.notebook_dir='.'", "--NotebookApp.open_browser=True", "-y", _NOTEBOOK_FILE), 
+        requires=(("notebook",),), 
+        prepare=_ensure_notebook, 
+        references=("https://jupyter-notebook.readthedocs.io/en/latest/",), 
+    ), 
+    dict(
+        name="euporie console", module="euporie.core", 
+        args=("console",), 
+        requires=(("euporie",),), 
+        references=(
+            "https://pypi.org/project/euporie/", 
+            "https://euporie.readthedocs.io/en/latest/apps/console.html", 
+        ), 
+    ), 
+    dict(
+        name="euporie notebook", module="euporie.core", 
+        args=("notebook", _NOTEBOOK_FILE), 
+        requires=(("euporie",),), 
+        references=(
+            "https://pypi.org/project/euporie/", 
+            "https://euporie.readthedocs.io/en/latest/apps/notebook.html", 
+        ), 
+    ), 
+    # dict(
+    #     name="jpterm", module="jpterm", 
+    #     requires=(("jpterm",),), 
+    #     references=("https://pypi.org/project/jpterm/",), 
+    # ), 
+    dict(
+        name="qtconsole", module="qtconsole", 
+        requires=(("qtconsole",),), 
+        references=("https://pypi.org/project/qtconsole/",), 
+    ), 
+    dict(
+        name="spyder", module="spyder.app.start", 
+        args=lambda: (*_SPYDER_ARGS, environ["PLUGIN_OUTDIR"]), 
+        requires=(("spyder",),), 
+        references=("https://pypi.org/project/spyder/",), 
+    ), 
+    dict(
+        name="idle", module="idlelib", 
+        args=(*_IDLE_ARGS, "-s"), 
+        references=("https://docs.python.org/3/library/idle.html",), 
+    ), 
+    dict(
+        name="idlex", module="idlexlib.launch", 
+        args=lambda: (*_IDLE_ARGS, "-r", environ["PYTHONSTARTUP"]), 
+        requires=(("idlexlib", "idlex"),), 
+        references=("https://idlex.sourceforge.net",), 
+    ), 
+    dict(
+        name="idlea", module="idlealib", 
+        args=lambda: (*_IDLE_ARGS, "-r", environ["PYTHONSTARTUP"]), 
+        requires=(("idlealib", "idlea"),), 
+        references=("https://pypi.org/project/idlea/",), 
+    ), 
+    dict(
+        name="thonny", module="thonny", 
+        args=lambda: (environ["PYTHONSTARTUP"],), 
+        requires=(("thonny",),), 
+        references=("https://thonny.org",), 
+    ), 
+    dict(
+        name="eric", module="eric7.eric7_ide", 
+        args=lambda: (environ["PYTHONSTARTUP"],), 
+        requires=(("eric7", "eric-ide"),), 
+        references=("https://eric-ide.python-projects.org",), 
+    ), 
+)
+
+CONSOLE_MAP.update((intern(name), start) for name, start in (
+    ("python(embed)", start_embedded_python), 
+    ("ipython(embed)", start_embedded_ipython), 
+    ("bpython(embed)", start_embedded_bpython), 
+    ("ptpython(embed)", start_embedded_ptpython), 
+    ("ptipython(embed)", start_embedded_ptipython), 
+    ("python", start_python), 
+    *((spec["name"], _make_console_starter(**spec)) for spec in _CONSOLE_SPECS), 
+))
+_CONSOLE_NAMES = tuple(CONSOLE_MAP)
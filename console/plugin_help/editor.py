@@ -12,24 +12,31 @@ __author__  = "ChenyangGao <https://chenyanggao.github.io/>"
 __version__ = (0, 1, 4)
 __all__ = [
     "html_fromstring", "html_tostring", "xml_fromstring", "xml_tostring", 
-    "IterMatchInfo", "re_iter", "re_sub", "WriteBack", "DoNotWriteBack", "edit", 
+    "IterMatchInfo", "re_iter", "re_iter_many", "re_sub", "re_sub_many", "WriteBack", "DoNotWriteBack", "edit", 
     "ctx_edit", "ctx_edit_sgml", "ctx_edit_html", "read_iter", "read_html_iter", 
     "edit_iter", "edit_batch", "edit_html_iter", "edit_html_batch", 
-    "EditCache", "TextEditCache", 
+    "EditCache", "TextEditCache", "set_default_bc", "bc_context", 
+    "read_cache", 
 ]
 
 import sys
 
+from collections import OrderedDict
 from contextlib import contextmanager
+from contextvars import copy_context, ContextVar, Token
 from enum import Enum
-from functools import partial
-from re import compile as re_compile, Match, Pattern
+from functools import lru_cache, partial
+from itertools import chain, repeat
+from queue import SimpleQueue
+from re import compile as re_compile, Match, Pattern, IGNORECASE, MULTILINE, DOTALL, VERBOSE, UNICODE
 from typing import (
     cast, Any, AnyStr, Callable, ContextManager, Dict, Final, 
     Generator, Iterable, Iterator, List, Mapping, MutableMapping, 
-    NamedTuple, Optional, Tuple, TypeVar, Union, 
+    NamedTuple, Optional, Set, Tuple, TypeVar, Union, 
 )
+from threading import Lock, RLock, Thread
 from types import MappingProxyType
+from weakref import WeakKeyDictionary
 
 try:
     from bookcontainer import BookContainer # type: ignore
@@ -44,7 +51,9 @@ try:
 
     from cssselect.xpath import GenericTranslator # type: ignore
     from lxml.cssselect import CSSSelector # type: ignore
-    from lxml.etree import _Element as Element, XPath # type: ignore
+    from lxml.etree import ( # type: ignore
+        _Element as Element, Element as _element_factory, XPath, XPathEvaluator, 
+    )
 except ImportError:
     from xml.etree.ElementTree import Element
     from plugin_util.htmlparser import ( # type: ignore
@@ -57,10 +66,203 @@ else:
     )
     _LXML_IMPORTED = True
 
+try:
+    from re import _parser as sre_parse # type: ignore # Python >= 3.11
+except ImportError:
+    import sre_parse # type: ignore
+
+try:
+    import hyperscan # type: ignore
+except ImportError:
+    _HYPERSCAN_IMPORTED = False
+else:
+    _HYPERSCAN_IMPORTED = True
+
 
 T = TypeVar("T")
 PatternType = Union[AnyStr, Pattern]
 
+_bc_ctx: ContextVar[Optional[BookContainer]] = ContextVar("_bc_ctx", default=None)
+
+
+def set_default_bc(bc: Optional[BookContainer]) -> Token:
+    """Set the default `BookContainer` object of the current context, 
+    it will be used when the argument `bc` is omitted (None) in this module.
+
+    :param bc: `BookContainer` object, or None to unset.
+
+    :return: A `contextvars.Token` object of the previous value.
+        Use `bc_context` instead, if you want to set it temporarily.
+    """
+    return _bc_ctx.set(bc)
+
+
+@contextmanager
+def bc_context(bc: Optional[BookContainer]) -> Generator[Optional[BookContainer], None, None]:
+    """Temporarily set the default `BookContainer` object of the current context.
+
+    :param bc: `BookContainer` object.
+
+    :Examples:
+
+        .. code-block:: python
+
+            with bc_context(bc):
+                re_sub(r"\\s+(?=</p>)", "")
+    """
+    token = _bc_ctx.set(bc)
+    try:
+        yield bc
+    finally:
+        _bc_ctx.reset(token)
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: AnyStr, flags: int = 0) -> Pattern:
+    """Compile a regular expression pattern, with a cache which is larger than 
+    the internal cache of the module `re` (and will not be wiped out when full)."""
+    return re_compile(pattern, flags)
+
+
+def _ascii_only_items(items) -> bool:
+    """Helper function for `_matches_ascii_only`, check the parsed items of a pattern."""
+    for op, av in items:
+        name = str(op)
+        if name == "LITERAL":
+            if av >= 0x80:
+                return False
+        elif name == "IN":
+            for op_, av_ in av:
+                name_ = str(op_)
+                if name_ == "LITERAL":
+                    if av_ >= 0x80:
+                        return False
+                elif name_ == "RANGE":
+                    if av_[1] >= 0x80:
+                        return False
+                else: # NEGATE, CATEGORY (e.g. \w, \d, \s)
+                    return False
+        elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+            if not _ascii_only_items(av[2]):
+                return False
+        elif name == "SUBPATTERN":
+            if av[1] & IGNORECASE or not _ascii_only_items(av[3]):
+                return False
+        elif name == "BRANCH":
+            if not all(map(_ascii_only_items, av[1])):
+                return False
+        elif name in ("ASSERT", "ASSERT_NOT"):
+            if not _ascii_only_items(av[1]):
+                return False
+        elif name == "ATOMIC_GROUP":
+            if not _ascii_only_items(av):
+                return False
+        elif name == "GROUPREF_EXISTS":
+            if not _ascii_only_items(av[1]) or (
+                av[2] is not None and not _ascii_only_items(av[2])
+            ):
+                return False
+        elif name == "AT":
+            if str(av) in ("AT_BOUNDARY", "AT_NON_BOUNDARY"):
+                return False
+        elif name != "GROUPREF":
+            # e.g. ANY (.) and NOT_LITERAL ([^a]) may match a non-ASCII character, 
+            # which is more than one byte in UTF-8
+            return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _matches_ascii_only(pattern: str, flags: int = 0) -> bool:
+    """Helper function to check whether the `str` pattern can only match ASCII characters 
+    (with the same meaning as in a bytes pattern), i.e. it is composed of ASCII literals, 
+    positive character classes of them, repetitions, groups, alternations, lookarounds, 
+    backreferences and anchors, and it does not ignore case."""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+        # e.g. the escapes \u, \U and \N are not allowed in bytes patterns
+        _compile(pattern.encode("ascii"), flags & ~UNICODE)
+    except Exception:
+        return False
+    return not parsed.state.flags & IGNORECASE and _ascii_only_items(parsed)
+
+
+def _ensure_pattern(pattern: PatternType, binary: bool = False) -> Pattern:
+    """Helper function to guarantee that the return value is `re.Pattern` type, 
+    if `binary` is True, a `str` pattern which can only match ASCII characters 
+    will be converted to a bytes pattern (see `_matches_ascii_only`). 
+    Other `str` patterns are kept as is, because they would match differently 
+    in the UTF-8 encoded bytes (e.g. "é+", r"\w+", "." or IGNORECASE)."""
+    if binary:
+        if isinstance(pattern, Pattern):
+            if isinstance(pattern.pattern, str) and _matches_ascii_only(pattern.pattern, pattern.flags):
+                return _compile(pattern.pattern.encode("ascii"), pattern.flags & ~UNICODE)
+            return pattern
+        elif isinstance(pattern, str) and _matches_ascii_only(pattern):
+            pattern = pattern.encode("ascii")
+    elif isinstance(pattern, Pattern):
+        return pattern
+    return _compile(pattern)
+
+
+_REGEX_SPECIAL_CHARS: Final[str] = ".^$*+?{}[]\\|()"
+_REGEX_SPECIAL_STR: Final[frozenset] = frozenset(_REGEX_SPECIAL_CHARS)
+_REGEX_SPECIAL_BYTES: Final[frozenset] = frozenset(_REGEX_SPECIAL_CHARS.encode("ascii"))
+
+
+@lru_cache(maxsize=1024)
+def _literal_of(pattern: Pattern) -> Optional[AnyStr]:
+    """Helper function to check whether the pattern only matches a literal string 
+    (not empty, without special characters, and not ignoring case), if so, return the string. 
+    The escaped special characters and simple escapes (e.g. r"\.", r"\xa0", r"\u3000") 
+    are resolved into the literal."""
+    literal = pattern.pattern
+    if not literal:
+        return None
+    special = _REGEX_SPECIAL_STR if isinstance(literal, str) else _REGEX_SPECIAL_BYTES
+    if not pattern.flags & ~UNICODE and special.isdisjoint(literal):
+        return literal
+    parsed = sre_parse.parse(literal, pattern.flags)
+    if parsed.state.flags & IGNORECASE or not all(str(op) == "LITERAL" for op, _ in parsed):
+        return None
+    codes = [av for _, av in parsed]
+    if not codes:
+        return None
+    if isinstance(literal, str):
+        return "".join(map(chr, codes))
+    return bytes(codes)
+
+
+def _sub_function(pattern: Pattern, repl) -> Callable:
+    """Helper function to get the substitution function `fn(repl, string)` of the pattern, 
+    if the pattern is literal and `repl` is a string without backslash escapes, 
+    `str.replace` (or `bytes.replace`) is used instead of the regular expression engine."""
+    literal = _literal_of(pattern)
+    if literal is None or callable(repl) or (
+        ("\\" if isinstance(repl, str) else b"\\") in repl
+    ):
+        return pattern.sub
+    return lambda repl, string: string.replace(literal, repl)
+
+
+_INLINE_FLAGS: Final[Tuple[Tuple[int, str], ...]] = (
+    (IGNORECASE, "i"), (MULTILINE, "m"), (DOTALL, "s"), (VERBOSE, "x"), 
+)
+
+
+def _combine_patterns(patterns: Mapping[str, PatternType]) -> Pattern:
+    """Combine the patterns into one pattern, each of them is in a named group 
+    (the name is the key), the flags of compiled patterns are kept as scoped inline flags."""
+    parts: List[str] = []
+    for name, pattern in patterns.items():
+        if isinstance(pattern, Pattern):
+            flags = "".join(c for f, c in _INLINE_FLAGS if pattern.flags & f)
+            pattern = pattern.pattern
+            if flags:
+                pattern = "(?%s:%s)" % (flags, pattern)
+        parts.append("(?P<%s>%s)" % (name, pattern))
+    return _compile("|".join(parts))
+
 
 def _ensure_bc(
     bc: Optional[BookContainer] = None, 
@@ -71,6 +273,9 @@ def _ensure_bc(
     if isinstance(bc, BookContainer):
         return bc
     elif bc is None:
+        bc = _bc_ctx.get()
+        if bc is not None:
+            return bc
         try:
             bc = sys._getframe(frame_back).f_globals["bc"]
             if not isinstance(bc, BookContainer):
@@ -82,6 +287,115 @@ def _ensure_bc(
     raise TypeError("Expected type %r, got %r" % (BookContainer, type(bc)))
 
 
+class _ReadCache:
+    """A LRU cache of the file contents read from a `BookContainer` object, 
+    used by `read_cache`."""
+    __slots__ = ("bc", "maxsize", "data")
+
+    def __init__(self, bc: BookContainer, maxsize: int = 64):
+        self.bc = bc
+        self.maxsize = maxsize
+        self.data: OrderedDict[str, Union[bytes, str]] = OrderedDict()
+
+    def readfile(self, fid: str) -> Union[bytes, str]:
+        data = self.data
+        try:
+            content = data[fid]
+        except KeyError:
+            content = data[fid] = self.bc.readfile(fid)
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+        else:
+            data.move_to_end(fid)
+        return content
+
+    def writefile(self, fid: str, content: Union[bytes, str]) -> None:
+        self.data.pop(fid, None)
+        self.bc.writefile(fid, content)
+
+
+_read_cache_ctx: ContextVar[Optional[_ReadCache]] = ContextVar("_read_cache_ctx", default=None)
+
+
+@contextmanager
+def read_cache(
+    bc: Optional[BookContainer] = None, 
+    maxsize: int = 64, 
+) -> Generator[None, None, None]:
+    """Within the context, the file contents of `bc` read by the functions of this module 
+    are cached (at most `maxsize` files, least recently used are discarded first), 
+    so the files are not read repeatedly by successive passes.
+
+    **NOTE**: The cached content of a file is discarded when it is written back 
+    by the functions of this module, but if you call `bc.writefile` directly 
+    within the context, the cached content of that file will be stale.
+
+    :param bc: `BookContainer` object. 
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
+        `BookContainer` object is an object of ePub book content provided by Sigil, 
+        which can be used to access and operate the files in ePub.
+    :param maxsize: The maximum number of cached files.
+
+    :Examples:
+
+        .. code-block:: python
+
+            with read_cache(bc):
+                if any(re_iter(r"<br\\s*>", bc=bc)):
+                    re_sub(r"<br\\s*>", "<br/>", bc=bc)
+    """
+    bc = cast(BookContainer, _ensure_bc(bc, 3))
+    token = _read_cache_ctx.set(_ReadCache(bc, maxsize))
+    try:
+        yield
+    finally:
+        _read_cache_ctx.reset(token)
+
+
+# `BookContainer` object -> the lock to serialize the reading and writing of its files 
+# (and the access to its `read_cache`), because `BookContainer` is not thread-safe
+_BC_LOCKS: WeakKeyDictionary = WeakKeyDictionary()
+_BC_LOCKS_LOCK: Final = Lock()
+
+
+def _bc_lock(bc: BookContainer) -> RLock:
+    """Helper function to get the lock of a `BookContainer` object."""
+    try:
+        return _BC_LOCKS[bc]
+    except KeyError:
+        with _BC_LOCKS_LOCK:
+            return _BC_LOCKS.setdefault(bc, RLock())
+
+
+def _readfile(bc: BookContainer, fid: str) -> Union[bytes, str]:
+    """Helper function to read a file, through the cache of `read_cache` if available."""
+    cache = _read_cache_ctx.get()
+    with _bc_lock(bc):
+        if cache is not None and cache.bc is bc:
+            return cache.readfile(fid)
+        return bc.readfile(fid)
+
+
+def _writefile(bc: BookContainer, fid: str, content: Union[bytes, str]) -> None:
+    """Helper function to write a file, and discard its content in the cache of `read_cache`."""
+    cache = _read_cache_ctx.get()
+    with _bc_lock(bc):
+        if cache is not None and cache.bc is bc:
+            cache.writefile(fid, content)
+        else:
+            bc.writefile(fid, content)
+
+
+def _manifest_getters(
+    bc: BookContainer, 
+) -> Tuple[Callable[..., Optional[str]], Callable[..., Optional[str]]]:
+    """Helper function to get the lookup functions of (href, mimetype) by manifest id, 
+    they look up the manifest mappings of the wrapper directly."""
+    w = bc._w
+    return w.id_to_href.get, w.id_to_mime.get
+
+
 class IterMatchInfo(NamedTuple):
     """Context information wrapper for regular expression matches.
 
@@ -108,13 +422,39 @@ class IterMatchInfo(NamedTuple):
     string: Union[bytes, str]
 
 
+class _MatchView:
+    """A mutable view with the same fields as `IterMatchInfo`, it is reused 
+    between matches, so it only reflects the current match. 
+    Call the `freeze` method to get a snapshot."""
+    __slots__ = IterMatchInfo._fields
+
+    def __init__(self, bc, manifest_id, file_no, href, mimetype, string):
+        self.bc = bc
+        self.manifest_id = manifest_id
+        self.local_no = 0
+        self.file_no = file_no
+        self.href = href
+        self.mimetype = mimetype
+        self.string = string
+
+    def __repr__(self):
+        return "<%s %s>" % (type(self).__qualname__, self.freeze())
+
+    def freeze(self) -> IterMatchInfo:
+        """Return a `IterMatchInfo` object of the current match."""
+        return IterMatchInfo(*(getattr(self, f) for f in self.__slots__))
+
+
 def re_iter(
     pattern: PatternType, 
     manifest_id_s: Union[None, str, Iterable[str]] = None, 
     bc: Optional[BookContainer] = None, 
     errors: str = "ignore", 
     more_info: bool = False, 
-) -> Union[Generator[Match, None, None], Generator[IterMatchInfo, None, None]]:
+    binary: bool = False, 
+    reuse_info: bool = False, 
+    engine: str = "re", 
+) -> Union[Iterator[Match], Iterator[IterMatchInfo], Iterator[Tuple[str, int, int]]]:
     """Iterate over each of the files corresponding to the given manifest_id_s 
     with regular expressions, and yield matches one by one.
 
@@ -126,7 +466,8 @@ def re_iter(
 
         If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param errors: Strategies for errors, it can take a value in ("ignore", "raise", "skip").
@@ -150,8 +491,33 @@ def re_iter(
             - **match**: The regular expression match object
             - **string**: The content of the current file
 
-    :return: Generator, if `more_info` is True, then yield `IterMatchInfo` object, 
-             else yield `Element` object.
+    :param binary: If true, scan the UTF-8 encoded bytes of the files, instead of the 
+        decoded text, a `str` pattern will be encoded to a `bytes` pattern, if it can only 
+        match ASCII characters (ASCII literals, positive character classes of them, groups, 
+        repetitions, alternations, lookarounds, backreferences and anchors other than \\b, 
+        without IGNORECASE). This also makes it possible to scan the non-text files. 
+        Any other `str` pattern (e.g. "é+", r"\\w+", r"\\xe9", "." or "[^<]") is kept as is, 
+        because it would match differently in the bytes, and the decoded text is scanned.
+    :param reuse_info: This parameter only takes effect when `more_info` is True.
+        If true, for each file, an object with the same fields as `IterMatchInfo` 
+        will be yielded repeatedly and be updated in place, call its `freeze` method 
+        to get a `IterMatchInfo` object, if you need to keep it.
+    :param engine: The regular expression engine, it can take a value in ("re", "hyperscan").
+
+        - **re**: Use the module `re`.
+        - **hyperscan**: Use `Hyperscan <https://www.hyperscan.io/>` (the package `hyperscan` 
+          is required), it's much faster for scanning lots of files, which mostly have no match. 
+          Hyperscan only picks out the files that have a match, in which the matches are 
+          then located by the module `re`, so the results are the same as with "re" 
+          (non-overlapping matches), regardless of whether Hyperscan is used. 
+          The files are scanned as if `binary` is True, and `more_info` is ignored. 
+          If the package `hyperscan` is not available, or the pattern is not supported 
+          by Hyperscan (e.g. backreferences, lookarounds), only the module `re` is used.
+
+    :return: Iterator, if `engine` is "hyperscan", then yield 3-tuples of 
+             (manifest id, start byte offset, end byte offset), 
+             elif `more_info` is True, then yield `IterMatchInfo` object, 
+             else yield `Match` object.
 
     :Examples:
 
@@ -163,44 +529,258 @@ def re_iter(
     """
     bc = cast(BookContainer, _ensure_bc(bc))
 
-    fn: Callable = re_compile(pattern).finditer
+    if engine == "hyperscan":
+        utf8 = isinstance(pattern.pattern if isinstance(pattern, Pattern) else pattern, str)
+        binary = True
+    elif engine != "re":
+        raise ValueError("engine must be 're' or 'hyperscan', got %r" % engine)
+
+    pattern = _ensure_pattern(pattern, binary)
+    # A non-ASCII `str` pattern is not converted, then the decoded text is scanned
+    binary = isinstance(pattern.pattern, bytes)
+    fn: Callable = pattern.finditer
 
     if manifest_id_s is None:
         manifest_id_s = (info[0] for info in bc.text_iter())
     elif isinstance(manifest_id_s, str):
         manifest_id_s = (manifest_id_s,)
 
+    readfile: Callable = partial(_readfile, bc)
+    if binary:
+        def readfile(fid):
+            data = _readfile(bc, fid)
+            if isinstance(data, str):
+                return data.encode("utf-8")
+            return data
+
+    if engine == "hyperscan":
+        return _hs_iter(pattern, utf8, readfile, manifest_id_s, errors)
     if more_info:
-        local_no: int  = 1
-        global_no: int = 1
-        file_no: int   = 1
+        return _re_iter_info(bc, fn, readfile, manifest_id_s, errors, reuse_info)
+    # The matches of all files are chained in C, without a generator frame per match
+    if errors == "raise":
+        return chain.from_iterable(map(fn, map(readfile, manifest_id_s)))
+    return chain.from_iterable(_finditer_each(fn, readfile, manifest_id_s))
+
+
+def _finditer_each(
+    fn: Callable, 
+    readfile: Callable, 
+    manifest_id_s: Iterable[str], 
+) -> Generator[Iterator[Match], None, None]:
+    """Helper function for `re_iter`, yield the match iterator of each file, 
+    ignore the files that cannot be read or scanned."""
+    for fid in manifest_id_s:
+        try:
+            yield fn(readfile(fid))
+        except Exception:
+            pass
+
+
+@lru_cache(maxsize=64)
+def _hs_compile(pattern: bytes, flags: int = 0, utf8: bool = False):
+    """Helper function to compile a pattern into a Hyperscan database, 
+    return None if the pattern (or any of its flags) is not supported."""
+    # Only these flags can be translated, others (e.g. VERBOSE) would change the meaning
+    if flags & ~(IGNORECASE | MULTILINE | DOTALL | UNICODE):
+        return None
+    hs_flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    if flags & IGNORECASE:
+        hs_flags |= hyperscan.HS_FLAG_CASELESS
+    if flags & MULTILINE:
+        hs_flags |= hyperscan.HS_FLAG_MULTILINE
+    if flags & DOTALL:
+        hs_flags |= hyperscan.HS_FLAG_DOTALL
+    if utf8:
+        hs_flags |= hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    db = hyperscan.Database()
+    try:
+        db.compile(expressions=[pattern], ids=[0], elements=1, flags=[hs_flags])
+    except hyperscan.error:
+        return None
+    return db
 
-        for fid in manifest_id_s:
-            href = bc.id_to_href(fid)
-            mime = bc.id_to_mime(fid)
-            try:
-                string = bc.readfile(fid)
-                local_no = 1
-                for match in fn(string):
-                    yield IterMatchInfo(
-                        bc, fid, local_no, global_no, file_no, 
-                        href, mime, match, string)
-                    local_no  += 1
+
+def _hs_iter(
+    pattern: Pattern, 
+    utf8: bool, 
+    readfile: Callable, 
+    manifest_id_s: Iterable[str], 
+    errors: str = "ignore", 
+) -> Generator[Tuple[str, int, int], None, None]:
+    """Helper function for `re_iter`, yield (manifest id, start byte offset, end byte offset) 
+    of the matches found by the module `re`, the files without any match are skipped 
+    by Hyperscan beforehand (if it is available)."""
+    db = None
+    if _HYPERSCAN_IMPORTED:
+        expression = pattern.pattern
+        if isinstance(expression, str):
+            expression = expression.encode("utf-8")
+        db = _hs_compile(expression, pattern.flags, utf8)
+    for fid in manifest_id_s:
+        try:
+            data = readfile(fid)
+            if db is not None and not _hs_has_match(
+                db, data.encode("utf-8") if isinstance(data, str) else data
+            ):
+                continue
+            matches = pattern.finditer(data)
+            if isinstance(data, str):
+                # A non-ASCII `str` pattern scans the text, convert to byte offsets
+                spans = list(_byte_spans(matches, data))
+            else:
+                spans = [match.span() for match in matches]
+        except Exception:
+            if errors == "raise":
+                raise
+            continue
+        for start, end in spans:
+            yield fid, start, end
+
+
+def _hs_has_match(db, data: bytes) -> bool:
+    """Helper function for `_hs_iter`, scan `data` with the Hyperscan database `db`, 
+    and stop at the first match."""
+    try:
+        db.scan(data, match_event_handler=lambda _id, _start, _end, _flags, _ctx: True)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _byte_spans(matches: Iterable[Match], text: str) -> Iterator[Tuple[int, int]]:
+    """Helper function for `_hs_iter`, convert the (non-overlapping, increasing) spans 
+    of the matches in `text` to the offsets in its UTF-8 encoded bytes."""
+    pos = bpos = 0
+    for match in matches:
+        start, end = match.span()
+        bpos += len(text[pos:start].encode("utf-8"))
+        bstart = bpos
+        bpos += len(text[start:end].encode("utf-8"))
+        pos = end
+        yield bstart, bpos
+
+
+def _re_iter_info(
+    bc: BookContainer, 
+    fn: Callable, 
+    readfile: Callable, 
+    manifest_id_s: Iterable[str], 
+    errors: str = "ignore", 
+    reuse_info: bool = False, 
+) -> Generator[IterMatchInfo, None, None]:
+    """Helper function for `re_iter`, yield the matches with context information."""
+    id_to_href, id_to_mime = _manifest_getters(bc)
+    local_no: int  = 1
+    global_no: int = 1
+    file_no: int   = 1
+
+    for fid in manifest_id_s:
+        href = id_to_href(fid)
+        mime = id_to_mime(fid)
+        try:
+            string = readfile(fid)
+            if reuse_info:
+                view = _MatchView(bc, fid, file_no, href, mime, string)
+                for view.local_no, view.match in enumerate(fn(string), 1):
+                    view.global_no = global_no
+                    yield view # type: ignore
                     global_no += 1
-            except:
-                if errors == "skip":
-                    continue
-                elif errors == "raise":
-                    raise
-            file_no += 1
+                file_no += 1
+                continue
+            local_no = 1
+            for match in fn(string):
+                yield IterMatchInfo(
+                    bc, fid, local_no, global_no, file_no, 
+                    href, mime, match, string)
+                local_no  += 1
+                global_no += 1
+        except Exception:
+            if errors == "skip":
+                continue
+            elif errors == "raise":
+                raise
+        file_no += 1
+
+
+def re_iter_many(
+    patterns: Mapping[str, PatternType], 
+    manifest_id_s: Union[None, str, Iterable[str]] = None, 
+    bc: Optional[BookContainer] = None, 
+    errors: str = "ignore", 
+    more_info: bool = False, 
+) -> Union[Generator[Tuple[str, Match], None, None], Generator[Tuple[str, IterMatchInfo], None, None]]:
+    """Iterate over each of the files corresponding to the given manifest_id_s 
+    with multiple regular expressions in one pass, and yield matches one by one.
+
+    **NOTE**: The patterns are combined into one alternation, so at each position, 
+    the first pattern (in the order of `patterns`) that matches wins, 
+    and the numbered backreferences in the patterns will be shifted.
+
+    :param patterns: A mapping of names to regular expression patterns (string or compiled object), 
+        the names must be valid group names of regular expression.
+    :param manifest_id_s: Manifest id collection, are listed in OPF file,
+        The XPath as following (the `namespace` depends on the specific situation):
+
+            /namespace:package/namespace:manifest/namespace:item/@id
+
+        If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
+    :param bc: `BookContainer` object. 
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
+        `BookContainer` object is an object of ePub book content provided by Sigil, 
+        which can be used to access and operate the files in ePub.
+    :param errors: Strategies for errors, it can take a value in ("ignore", "raise", "skip").
+    :param more_info: Will pass to function `re_iter` as keyword argument.
+
+    :return: Generator, yield 2-tuples, the first is the name of the matched pattern, 
+             the second is the match object (or `IterMatchInfo` object, if `more_info` is True).
+
+    :Examples:
+
+        .. code-block:: python
+
+            for name, match in re_iter_many({"img": r"<img\\b[^>]*>", "link": r"<a\\b[^>]*>"}):
+                print(name, match)
+    """
+    bc = cast(BookContainer, _ensure_bc(bc))
+
+    it = re_iter(_combine_patterns(patterns), manifest_id_s, bc, errors, more_info)
+    if more_info:
+        for info in it:
+            yield info.match.lastgroup, info
     else:
-        for fid in manifest_id_s:
-            try:
-                string = bc.readfile(fid)
-                yield from fn(string)
-            except:
-                if errors == "raise":
-                    raise
+        for match in it:
+            yield match.lastgroup, match
+
+
+_worker_sub: Optional[Callable] = None
+
+
+def _init_sub_worker(pattern: Pattern) -> None:
+    """Helper function to initialize the worker process of `re_sub`."""
+    global _worker_sub
+    _worker_sub = pattern.sub
+
+
+def _sub_in_worker(repl, string: AnyStr) -> Tuple[Optional[AnyStr], Optional[Exception]]:
+    """Helper function to do the replacement in the worker process of `re_sub`, 
+    returns a 2-tuple of (replaced string or None, exception or None)."""
+    try:
+        return cast(Callable, _worker_sub)(repl, string), None
+    except Exception as exc:
+        return None, exc
+
+
+def _is_picklable(obj) -> bool:
+    """Helper function to check whether `obj` can be pickled (to be sent to a worker process)."""
+    from pickle import dumps
+
+    try:
+        dumps(obj)
+    except Exception:
+        return False
+    return True
 
 
 def re_sub(
@@ -210,6 +790,7 @@ def re_sub(
     bc: Optional[BookContainer] = None, 
     errors: str = "ignore", 
     more_info: bool = False, 
+    workers: int = 1, 
 ) -> None:
     """Iterate over each of the files corresponding to the given manifest_id_s 
     with regular expressions, and replace all matches.
@@ -227,7 +808,8 @@ def re_sub(
 
         If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param errors: Strategies for errors, it can take a value in ("ignore", "raise", "skip").
@@ -251,6 +833,14 @@ def re_sub(
             - **match**: The regular expression match object
             - **string**: The content of the current file
 
+    :param workers: If it is greater than 1, and `more_info` does not take effect, 
+        the replacements will be done in a process pool with this many worker processes, 
+        the files are still read and written back in the current process. 
+        So `pattern` and `repl` must be picklable (e.g. `repl` is a string, 
+        or a function defined at the top level of a module), otherwise 
+        (e.g. `repl` is a lambda or a closure) the replacements are done in the 
+        current process.
+
     :Examples:
 
         .. code-block:: python
@@ -260,13 +850,42 @@ def re_sub(
     """
     bc = cast(BookContainer, _ensure_bc(bc))
 
-    fn: Callable = re_compile(pattern).sub
+    pattern = _ensure_pattern(pattern)
+    fn: Callable = _sub_function(pattern, repl)
 
     if manifest_id_s is None:
         manifest_id_s = (info[0] for info in bc.text_iter())
     elif isinstance(manifest_id_s, str):
         manifest_id_s = (manifest_id_s,)
 
+    if workers > 1 and not (more_info and callable(repl)) and _is_picklable(repl):
+        from concurrent.futures import ProcessPoolExecutor
+
+        fids: List[str] = []
+        strings: List[AnyStr] = []
+        for fid in manifest_id_s:
+            try:
+                strings.append(_readfile(bc, fid))
+            except Exception:
+                if errors == "raise":
+                    raise
+            else:
+                fids.append(fid)
+        with ProcessPoolExecutor(
+            workers, initializer=_init_sub_worker, initargs=(pattern,), 
+        ) as executor:
+            results = executor.map(_sub_in_worker, repeat(repl), strings)
+            for fid, string, (string_new, exc) in zip(fids, strings, results):
+                try:
+                    if exc is not None:
+                        raise exc
+                    if string != string_new:
+                        _writefile(bc, fid, string_new)
+                except Exception:
+                    if errors == "raise":
+                        raise
+        return
+
     if callable(repl):
         repl = cast(Callable[..., AnyStr], repl)
 
@@ -294,16 +913,17 @@ def re_sub(
         else:
             _repl = repl
 
+        id_to_href, id_to_mime = _manifest_getters(bc)
         for fid in manifest_id_s:
             old_global_no = global_no
             local_no = 1
-            href = bc.id_to_href(fid)
-            mime = bc.id_to_mime(fid)
+            href = id_to_href(fid)
+            mime = id_to_mime(fid)
             try:
-                string = bc.readfile(fid)
+                string = _readfile(bc, fid)
                 string_new = fn(_repl, string)
                 if string != string_new:
-                    bc.writefile(fid, string_new)
+                    _writefile(bc, fid, string_new)
             except:
                 if errors == "skip":
                     continue
@@ -313,15 +933,83 @@ def re_sub(
     else:
         for fid in manifest_id_s:
             try:
-                string = bc.readfile(fid)
+                string = _readfile(bc, fid)
                 string_new = fn(repl, string)
                 if string != string_new:
-                    bc.writefile(fid, string_new)
+                    _writefile(bc, fid, string_new)
             except:
                 if errors == "raise":
                     raise
 
 
+def re_sub_many(
+    pairs: Union[
+        Mapping[PatternType, Union[AnyStr, Callable[[Match], AnyStr]]], 
+        Iterable[Tuple[PatternType, Union[AnyStr, Callable[[Match], AnyStr]]]], 
+    ], 
+    manifest_id_s: Union[None, str, Iterable[str]] = None, 
+    bc: Optional[BookContainer] = None, 
+    errors: str = "ignore", 
+) -> None:
+    """Iterate over each of the files corresponding to the given manifest_id_s, 
+    and apply the replacements of multiple regular expressions in turn, 
+    each file will be read (and written back if changed) only once.
+
+    :param pairs: A mapping or an iterable of 2-tuples of (pattern, repl), 
+        the replacements are applied in order, see function `re_sub` for details.
+        If `repl` is a callable, it's passed the match object.
+    :param manifest_id_s: Manifest id collection, are listed in OPF file,
+        The XPath as following (the `namespace` depends on the specific situation):
+
+            /namespace:package/namespace:manifest/namespace:item/@id
+
+        If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
+    :param bc: `BookContainer` object. 
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
+        `BookContainer` object is an object of ePub book content provided by Sigil, 
+        which can be used to access and operate the files in ePub.
+    :param errors: Strategies for errors, it can take a value in ("ignore", "raise").
+
+        - **ignore**: Ignore the error (the file will not be changed) and continue processing.
+        - **raise**: Raise the error and stop processing.
+
+    :Examples:
+
+        .. code-block:: python
+
+            re_sub_many([
+                (r"[ \\t]+(?=\\n)", ""), # remove trailing whitespaces
+                (r"\\n{3,}", "\\n\\n"), # squeeze blank lines
+            ])
+    """
+    bc = cast(BookContainer, _ensure_bc(bc))
+
+    if isinstance(pairs, Mapping):
+        pairs = pairs.items()
+    subs: List[Tuple[Callable, Any]] = [
+        (_sub_function(_ensure_pattern(pattern), repl), repl) for pattern, repl in pairs]
+
+    if manifest_id_s is None:
+        manifest_id_s = (info[0] for info in bc.text_iter())
+    elif isinstance(manifest_id_s, str):
+        manifest_id_s = (manifest_id_s,)
+
+    for fid in manifest_id_s:
+        try:
+            string = string_new = _readfile(bc, fid)
+            for fn, repl in subs:
+                string_new = fn(repl, string_new)
+            if string != string_new:
+                _writefile(bc, fid, string_new)
+        except Exception:
+            if errors == "raise":
+                raise
+
+
+re_iter.cache_clear = re_sub.cache_clear = _compile.cache_clear # type: ignore
+
+
 class WriteBack(Exception):
     """If changes require writing back to the file, 
     you can raise this exception"""
@@ -348,8 +1036,10 @@ def edit(
             /namespace:package/namespace:manifest/namespace:item/@id
 
     :param operate: Take data in, operate on, and then return the changed data.
+        If it returns None, the data is regarded as unchanged.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
 
@@ -357,7 +1047,7 @@ def edit(
     """
     bc = cast(BookContainer, _ensure_bc(bc))
 
-    content = bc.readfile(manifest_id)
+    content = _readfile(bc, manifest_id)
 
     try:
         content_new = operate(content)
@@ -365,11 +1055,12 @@ def edit(
         return False
     except WriteBack as exc:
         content_new = exc.data
-        if content_new is None:
-            return False
+
+    if content_new is None:
+        return False
 
     if content != content_new:
-        bc.writefile(manifest_id, content_new)
+        _writefile(bc, manifest_id, content_new)
         return True
 
     return False
@@ -389,7 +1080,8 @@ def ctx_edit(
             /namespace:package/namespace:manifest/namespace:item/@id
 
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param wrap_me: Whether to wrap up object, if True, 
@@ -444,7 +1136,7 @@ def ctx_edit(
     """
     bc = cast(BookContainer, _ensure_bc(bc, 3))
 
-    content = bc.readfile(manifest_id)
+    content = _readfile(bc, manifest_id)
 
     try:
         if wrap_me:
@@ -454,21 +1146,20 @@ def ctx_edit(
                 "write_back": True,
             }
             yield data
-            if data.get("data") is None or not data.get("write_back"):
-                raise DoNotWriteBack
-            content_new = data["data"]
+            content_new = data.get("data") if data.get("write_back") else None
         else:
             yield content
-            raise DoNotWriteBack
+            return False
     except DoNotWriteBack:
         return False
     except WriteBack as exc:
         content_new = exc.data
-        if content_new is None:
-            return False
+
+    if content_new is None:
+        return False
 
     if content != content_new:
-        bc.writefile(manifest_id, content_new)
+        _writefile(bc, manifest_id, content_new)
         return True
 
     return False
@@ -479,7 +1170,7 @@ def ctx_edit_sgml(
     manifest_id: str,
     bc: Optional[BookContainer] = None, 
     fromstring: Callable = xml_fromstring,
-    tostring: Callable[..., Union[bytes, bytearray, str]] = xml_tostring,
+    tostring: Callable[..., Union[bytes, bytearray, str]] = partial(xml_tostring, encoding="unicode"),
 ) -> Generator[Any, Any, bool]:
     """Read and yield the etree object (parsed from a xml file), 
     and then write back the above etree object.
@@ -490,12 +1181,14 @@ def ctx_edit_sgml(
             /namespace:package/namespace:manifest/namespace:item/@id
 
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param fromstring: Parses an XML or SGML document or fragment from a string.
         Returns the root node (or the result returned by a parser target).
-    :param tostring: Serialize an element to an encoded string representation of its XML or SGML tree.
+    :param tostring: Serialize an element to a string representation of its XML or SGML tree.
+        If it returns an encoded string (`bytes`), it will be decoded by UTF-8.
 
     :Examples:
 
@@ -511,8 +1204,12 @@ def ctx_edit_sgml(
     """
     bc = cast(BookContainer, _ensure_bc(bc, 3))
 
-    content = bc.readfile(manifest_id)
-    tree = fromstring(content.encode("utf-8"))
+    content = _readfile(bc, manifest_id)
+    try:
+        tree = fromstring(content)
+    except ValueError:
+        # e.g. `lxml.etree.fromstring` does not accept a `str` with encoding declaration
+        tree = fromstring(content.encode("utf-8"))
 
     try:
         yield tree
@@ -531,12 +1228,22 @@ def ctx_edit_sgml(
         content_new = content_new.decode("utf-8")
 
     if content != content_new:
-        bc.writefile(manifest_id, content_new)
+        _writefile(bc, manifest_id, content_new)
         return True
 
     return False
 
 
+@lru_cache(maxsize=None)
+def _html_serializer(mimetype: str) -> Callable[..., str]:
+    """Helper function to get the serializer for the (X)HTML file with the media type."""
+    return partial(
+        html_tostring, 
+        encoding="unicode", 
+        method="xhtml" if "xhtml" in mimetype else "html", 
+    )
+
+
 @contextmanager
 def ctx_edit_html(
     manifest_id: str, 
@@ -551,7 +1258,8 @@ def ctx_edit_html(
             /namespace:package/namespace:manifest/namespace:item/@id
 
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
 
@@ -573,10 +1281,7 @@ def ctx_edit_html(
         manifest_id, 
         bc, 
         html_fromstring, 
-        partial(
-            html_tostring, 
-            method="xhtml" if "xhtml" in bc.id_to_mime(manifest_id) else "html",
-        ),
+        _html_serializer(_manifest_getters(bc)[1](manifest_id, "")), 
     ))
 
 
@@ -593,7 +1298,8 @@ def read_iter(
 
         If manifest_id_s is None (the default), it will get by `bc.manifest_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     """
@@ -603,12 +1309,13 @@ def read_iter(
     if manifest_id_s is None:
         it = (info[:2] for info in bc.manifest_iter())
     elif isinstance(manifest_id_s, str):
-        it = (manifest_id_s, bc.id_to_href(manifest_id_s)), 
+        it = (manifest_id_s, _manifest_getters(bc)[0](manifest_id_s)), 
     else:
-        it = ((id, bc.id_to_href(id)) for id in manifest_id_s)
+        id_to_href = _manifest_getters(bc)[0]
+        it = ((id, id_to_href(id)) for id in manifest_id_s)
 
     for fid, href in it:
-        yield fid, href, bc.readfile(fid)
+        yield fid, href, _readfile(bc, fid)
 
 
 def read_html_iter(
@@ -624,7 +1331,8 @@ def read_html_iter(
 
         If manifest_id_s is None (the default), it will get by `bc.manifest_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     """
@@ -634,12 +1342,13 @@ def read_html_iter(
     if manifest_id_s is None:
         it = (info[:2] for info in bc.text_iter())
     elif isinstance(manifest_id_s, str):
-        it = (manifest_id_s, bc.id_to_href(manifest_id_s)), 
+        it = (manifest_id_s, _manifest_getters(bc)[0](manifest_id_s)), 
     else:
-        it = ((id, bc.id_to_href(id)) for id in manifest_id_s)
+        id_to_href = _manifest_getters(bc)[0]
+        it = ((id, id_to_href(id)) for id in manifest_id_s)
 
     for fid, href in it:
-        yield fid, href, html_fromstring(bc.readfile(fid).encode("utf-8"))
+        yield fid, href, html_fromstring(_readfile(bc, fid))
 
 
 def edit_iter(
@@ -657,7 +1366,8 @@ def edit_iter(
 
         If manifest_id_s is None (the default), it will get by `bc.manifest_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param wrap_me: Will pass to function ctx_edit as keyword argument.
@@ -713,18 +1423,75 @@ def edit_iter(
     elif isinstance(manifest_id_s, str):
         manifest_id_s = (manifest_id_s,)
 
-    for fid in manifest_id_s:
-        if yield_cm:
-            yield fid, ctx_edit(fid, bc, wrap_me=wrap_me)
+    if yield_cm:
+        return ((fid, ctx_edit(fid, bc, wrap_me=wrap_me)) for fid in manifest_id_s)
+    return _EditIter(bc, manifest_id_s, wrap_me)
+
+
+class _EditIter:
+    """The iterator returned by `edit_iter` (if `yield_cm` is False), 
+    it supports the same protocol as a generator: the data sent by the `send` method 
+    will be written back before moving to the next file."""
+    __slots__ = ("bc", "ids", "wrap_me", "_fid", "_content", "_data", "_send_data")
+
+    def __init__(
+        self, 
+        bc: BookContainer, 
+        ids: Iterable[str], 
+        wrap_me: bool = False, 
+    ):
+        self.bc = bc
+        self.ids = iter(ids)
+        self.wrap_me = wrap_me
+        self._fid: Optional[str] = None
+        self._content: Union[None, bytes, str] = None
+        self._data: Any = None
+        self._send_data: Any = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Tuple[str, Union[dict, bytes, str]]:
+        self._write_back()
+        fid = next(self.ids)
+        content = _readfile(self.bc, fid)
+        if self.wrap_me:
+            data: Any = {
+                "manifest_id": fid, 
+                "data": content,
+                "write_back": True,
+            }
         else:
-            with ctx_edit(fid, bc, wrap_me=wrap_me) as data:
-                recv_data = yield fid, data
-                if recv_data is not None:
-                    while True:
-                        send_data = recv_data
-                        recv_data = yield
-                        if recv_data is None:
-                            raise WriteBack(send_data)
+            data = content
+        self._fid, self._content, self._data = fid, content, data
+        return fid, data
+
+    def send(self, value: Any) -> Optional[Tuple[str, Union[dict, bytes, str]]]:
+        """If `value` is None, it is equivalent to `next(self)`, 
+        else `value` will be written back to the current file, 
+        before moving to the next file."""
+        if value is None:
+            return next(self)
+        if self._fid is None:
+            raise TypeError("can't send non-None value to a just-started iterator")
+        self._send_data = value
+        return None
+
+    def close(self) -> None:
+        """Stop iteration, the data of the current file will not be written back."""
+        self._fid = self._content = self._data = self._send_data = None
+        self.ids = iter(())
+
+    def _write_back(self) -> None:
+        fid = self._fid
+        if fid is None:
+            return
+        content, data, content_new = self._content, self._data, self._send_data
+        self._fid = self._content = self._data = self._send_data = None
+        if content_new is None and self.wrap_me and data.get("write_back"):
+            content_new = data.get("data")
+        if content_new is not None and content != content_new:
+            _writefile(self.bc, fid, content_new)
 
 
 class SuccessStatus(NamedTuple):
@@ -735,10 +1502,61 @@ class SuccessStatus(NamedTuple):
     error: Optional[Exception] = None
 
 
+def _call_operate(
+    operate: Callable, 
+    content: Union[bytes, str], 
+) -> Tuple[Union[None, bytes, str], Optional[Exception]]:
+    """Helper function to call `operate` for `edit_batch` (maybe in a worker process), 
+    returns a 2-tuple of (changed data or None (do not write back), exception or None)."""
+    try:
+        return operate(content), None
+    except DoNotWriteBack:
+        return None, None
+    except WriteBack as exc:
+        return exc.data, None
+    except Exception as exc:
+        return None, exc
+
+
+class _WriteQueue:
+    """Write the files back one by one (in order) in a background thread, 
+    so that the caller can go on without waiting for the writing."""
+    __slots__ = ("bc", "queue", "thread", "errors")
+
+    def __init__(self, bc: BookContainer):
+        self.bc = bc
+        self.queue: SimpleQueue = SimpleQueue()
+        # index -> exception, if failed to write back
+        self.errors: Dict[int, Exception] = {}
+        # run in a copy of the current context, so that `read_cache` is still available
+        self.thread = Thread(target=copy_context().run, args=(self._run,), daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        get, bc, errors = self.queue.get, self.bc, self.errors
+        while (item := get()) is not None:
+            i, fid, content = item
+            try:
+                _writefile(bc, fid, content)
+            except Exception as exc:
+                errors[i] = exc
+
+    def put(self, i: int, fid: str, content: Union[bytes, str]) -> None:
+        self.queue.put((i, fid, content))
+
+    def join(self) -> Dict[int, Exception]:
+        """Wait until all the files are written back, return the exceptions by index."""
+        self.queue.put(None)
+        self.thread.join()
+        return self.errors
+
+
 def edit_batch(
     operate: Callable, 
     manifest_id_s: Union[None, str, Iterable[str]] = None, 
     bc: Optional[BookContainer] = None, 
+    workers: int = 1, 
+    chunksize: int = 1, 
 ) -> List[SuccessStatus]:
     """Used to process a collection of specified files in ePub file one by one
 
@@ -749,10 +1567,23 @@ def edit_batch(
 
         If manifest_id_s is None (the default), it will get by `bc.manifest_iter()`.
     :param operate: Take data in, operate on, and then return the changed data.
+        If it returns None, the data is regarded as unchanged.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
+    :param workers: If it is greater than 1, `operate` will be called in a process pool 
+        with this many worker processes, the files are still read and written back 
+        in the current process. So `operate`, the data and the raised exceptions must 
+        be picklable (e.g. `operate` is defined at the top level of a module).
+    :param chunksize: The number of files sent to a worker process at a time, 
+        only takes effect when `workers` is greater than 1.
+
+    **NOTE**: The changed files are written back in a background thread, 
+    while the next files are being processed, all are written back before returning. 
+    The reading and writing of the files (of this module) are serialized by a lock 
+    of `bc`, but `operate` must not access `bc` directly.
 
     :return: List of tuples of success status.
 
@@ -774,13 +1605,48 @@ def edit_batch(
         manifest_id_s = (manifest_id_s,)
 
     success_status: List[SuccessStatus] = []
-    for fid in manifest_id_s:
-        try:
-            with ctx_edit(fid, bc) as content:
-                raise WriteBack(operate(content))
-            success_status.append(SuccessStatus(fid))
-        except Exception as exc:
-            success_status.append(SuccessStatus(fid, False, exc))
+    write_queue = _WriteQueue(bc)
+    try:
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # (index in success_status, manifest id, data)
+            tasks: List[Tuple[int, str, Union[bytes, str]]] = []
+            for fid in manifest_id_s:
+                try:
+                    tasks.append((len(success_status), fid, _readfile(bc, fid)))
+                    success_status.append(SuccessStatus(fid))
+                except Exception as exc:
+                    success_status.append(SuccessStatus(fid, False, exc))
+            with ProcessPoolExecutor(workers) as executor:
+                results = executor.map(
+                    _call_operate, 
+                    repeat(operate), 
+                    (content for _, _, content in tasks), 
+                    chunksize=chunksize, 
+                )
+                for (i, fid, content), (content_new, exc) in zip(tasks, results):
+                    if exc is not None:
+                        success_status[i] = SuccessStatus(fid, False, exc)
+                    elif content_new is not None and content != content_new:
+                        write_queue.put(i, fid, content_new)
+        else:
+            for i, fid in enumerate(manifest_id_s):
+                try:
+                    content = _readfile(bc, fid)
+                except Exception as exc:
+                    success_status.append(SuccessStatus(fid, False, exc))
+                    continue
+                content_new, exc = _call_operate(operate, content)
+                if exc is not None:
+                    success_status.append(SuccessStatus(fid, False, exc))
+                    continue
+                success_status.append(SuccessStatus(fid))
+                if content_new is not None and content != content_new:
+                    write_queue.put(i, fid, content_new)
+    finally:
+        for i, exc in write_queue.join().items():
+            success_status[i] = SuccessStatus(success_status[i].manifest_id, False, exc)
     return success_status
 
 
@@ -799,7 +1665,8 @@ def edit_html_iter(
 
         If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param wrap_me: Whether to wrap up object, if True, return a dict containing keys 
@@ -845,36 +1712,74 @@ def edit_html_iter(
     elif isinstance(manifest_id_s, str):
         manifest_id_s = (manifest_id_s,)
 
+    if yield_cm:
+        return ((fid, ctx_edit_html(fid, bc)) for fid in manifest_id_s)
+    elif wrap_me:
+        return _edit_html_iter_interactive(manifest_id_s, bc)
+    return _edit_html_iter_fast(manifest_id_s, bc)
+
+
+def _edit_html_iter_fast(
+    manifest_id_s: Iterable[str], 
+    bc: BookContainer, 
+):
+    """Helper generator for `edit_html_iter` (if `wrap_me` and `yield_cm` are both False), 
+    it yields the etree directly, and only falls into the `send` protocol when needed."""
     for fid in manifest_id_s:
-        if yield_cm:
-            yield fid, ctx_edit_html(fid, bc)
-        else:
-            with ctx_edit_html(fid, bc) as tree:
-                if wrap_me:
-                    data = {
-                        "manifest_id": fid, 
-                        "data": tree, 
-                        "write_back": True, 
-                    }
-                    recv_data = yield fid, data
+        with ctx_edit_html(fid, bc) as tree:
+            recv_data = yield fid, tree
+            if recv_data is not None:
+                while True:
+                    send_data = recv_data
+                    recv_data = yield
                     if recv_data is None:
-                        if data.get("data") is None or not data.get("write_back"):
-                            raise DoNotWriteBack
-                        raise WriteBack(data["data"])
-                else:
-                    recv_data = yield fid, tree
-                if recv_data is not None:
-                    while True:
-                        send_data = recv_data
-                        recv_data = yield
-                        if recv_data is None:
-                            raise WriteBack(send_data)
+                        raise WriteBack(send_data)
+
+
+def _edit_html_iter_interactive(
+    manifest_id_s: Iterable[str], 
+    bc: BookContainer, 
+):
+    """Helper generator for `edit_html_iter` (if `wrap_me` is True), 
+    it yields the dicts with keys ("manifest_id", "data", "write_back")."""
+    for fid in manifest_id_s:
+        with ctx_edit_html(fid, bc) as tree:
+            data = {
+                "manifest_id": fid, 
+                "data": tree, 
+                "write_back": True, 
+            }
+            recv_data = yield fid, data
+            if recv_data is None:
+                if data.get("data") is None or not data.get("write_back"):
+                    raise DoNotWriteBack
+                raise WriteBack(data["data"])
+            while True:
+                send_data = recv_data
+                recv_data = yield
+                if recv_data is None:
+                    raise WriteBack(send_data)
+
+
+def _edit_html_one(
+    operate: Callable[[Element], Any], 
+    fid: str, 
+    bc: BookContainer, 
+) -> SuccessStatus:
+    """Helper function to process a (X)HTML file for `edit_html_batch`."""
+    try:
+        with ctx_edit_html(fid, bc) as tree:
+            operate(tree)
+        return SuccessStatus(fid)
+    except Exception as exc:
+        return SuccessStatus(fid, False, exc)
 
 
 def edit_html_batch(
     operate: Callable[[Element], Any], 
     manifest_id_s: Union[None, str, Iterable[str]] = None, 
     bc: Optional[BookContainer] = None, 
+    workers: int = 1, 
 ) -> List[SuccessStatus]:
     """Used to process a collection of specified (X)HTML files in ePub file one by one
 
@@ -886,9 +1791,16 @@ def edit_html_batch(
 
         If manifest_id_s is None (the default), it will get by `bc.text_iter()`.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
+    :param workers: If it is greater than 1, the files will be processed in a thread pool 
+        with this many worker threads, each file is processed (read, parsed, operated on, 
+        serialized and written back) in one thread. Reading and writing back are serialized 
+        by a lock of `bc` (because `BookContainer` is not thread-safe), while parsing and 
+        serializing by lxml release the GIL, so they can run in parallel. 
+        `operate` must be thread-safe, and must not access `bc` directly.
 
     :return: List of tuples of success status.
 
@@ -908,15 +1820,18 @@ def edit_html_batch(
     elif isinstance(manifest_id_s, str):
         manifest_id_s = (manifest_id_s,)
 
-    success_status: List[SuccessStatus] = []
-    for fid in manifest_id_s:
-        try:
-            with ctx_edit_html(fid, bc) as tree:
-                operate(tree)
-            success_status.append(SuccessStatus(fid))
-        except Exception as exc:
-            success_status.append(SuccessStatus(fid, False, exc))
-    return success_status
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(workers) as executor:
+            # run each task in a copy of the current context, so that `read_cache` is still available
+            context = copy_context()
+            return list(executor.map(
+                lambda fid: context.copy().run(_edit_html_one, operate, fid, bc), 
+                manifest_id_s, 
+            ))
+
+    return [_edit_html_one(operate, fid, bc) for fid in manifest_id_s]
 
 
 if _LXML_IMPORTED:
@@ -943,6 +1858,28 @@ if _LXML_IMPORTED:
         element: Element
         etree: Element
 
+    class _ElementView:
+        """A mutable view with the same fields as `IterElementInfo`, it is reused 
+        between elements, so it only reflects the current element. 
+        Call the `freeze` method to get a snapshot."""
+        __slots__ = IterElementInfo._fields
+
+        def __init__(self, bc, manifest_id, file_no, href, mimetype, etree):
+            self.bc = bc
+            self.manifest_id = manifest_id
+            self.local_no = 0
+            self.file_no = file_no
+            self.href = href
+            self.mimetype = mimetype
+            self.etree = etree
+
+        def __repr__(self):
+            return "<%s %s>" % (type(self).__qualname__, self.freeze())
+
+        def freeze(self) -> IterElementInfo:
+            """Return a `IterElementInfo` object of the current element."""
+            return IterElementInfo(*(getattr(self, f) for f in self.__slots__))
+
     class EnumSelectorType(Enum):
         """Selector type enumeration.
 
@@ -970,6 +1907,135 @@ if _LXML_IMPORTED:
             raise TypeError(f"expected value's type in ({enum_cls!r}"
                             f", int, str), got {val_cls}")
 
+    def _freeze_namespaces(
+        namespaces: Optional[Mapping], 
+    ) -> Optional[frozenset]:
+        """Helper function to convert namespaces mapping to hashable form 
+        (regardless of the order of items)"""
+        if not namespaces:
+            return None
+        return frozenset(namespaces.items())
+
+    @lru_cache(maxsize=256)
+    def _compiled_xpath(path, namespaces):
+        return XPath(path, namespaces=None if namespaces is None else dict(namespaces))
+
+    @lru_cache(maxsize=256)
+    def _compiled_css(path, namespaces, translator):
+        return CSSSelector(
+            path, 
+            namespaces=None if namespaces is None else dict(namespaces), 
+            translator=translator, 
+        )
+
+    def compiled_xpath(
+        path: str, 
+        namespaces: Optional[Mapping] = None, 
+    ) -> XPath:
+        """Get a compiled `lxml.etree.XPath` object, which is cached, 
+        so the same expression will not be compiled repeatedly.
+
+        :param path: A XPath expression.
+        :param namespaces: Prefix-namespace mappings used by `path`.
+
+        :return: A `lxml.etree.XPath` object, calling it on an element (or tree) 
+                 returns the result of evaluation.
+
+        :Examples:
+
+            .. code-block:: python
+
+                select_imgs = compiled_xpath("//*[local-name()='img']")
+                for fid, tree in edit_html_iter():
+                    for img in select_imgs(tree):
+                        ...
+        """
+        return _compiled_xpath(path, _freeze_namespaces(namespaces))
+
+    def compiled_css(
+        path: str, 
+        namespaces: Optional[Mapping] = None, 
+        translator: Union[str, GenericTranslator] = "xml", 
+    ) -> CSSSelector:
+        """Get a compiled `lxml.cssselect.CSSSelector` object, which is cached, 
+        so the same expression will not be translated and compiled repeatedly.
+
+        :param path: A CSS Selector expression.
+        :param namespaces: Prefix-namespace mappings used by `path`.
+        :param translator: A CSS Selector expression to XPath expression translator object.
+
+        :return: A `lxml.cssselect.CSSSelector` object (a subclass of `lxml.etree.XPath`).
+        """
+        return _compiled_css(path, _freeze_namespaces(namespaces), translator)
+
+    def _compile_selector(
+        path: str, 
+        seltype: Union[int, str, EnumSelectorType] = EnumSelectorType.cssselect, 
+        namespaces: Optional[Mapping] = None, 
+        translator: Union[str, GenericTranslator] = "xml", 
+    ) -> XPath:
+        """Helper function to get the cached compiled selector by selector type."""
+        if EnumSelectorType.of(seltype) is EnumSelectorType.cssselect:
+            if not namespaces and translator == "xml":
+                select = _COMMON_CSS_SELECTORS.get(path)
+                if select is not None:
+                    return select
+            return compiled_css(path, namespaces, translator)
+        return compiled_xpath(path, namespaces)
+
+    # The commonly used CSS selectors (with attributes), compiled at import time. 
+    # The ones that only select by tag name (e.g. "img") do not need to be compiled, 
+    # see `_simple_select`.
+    _COMMON_CSS_SELECTORS: Final[Dict[str, CSSSelector]] = {
+        path: CSSSelector(path, translator="xml") 
+        for path in (
+            "a[href]", "img[src]", "link[href]", "link[rel=stylesheet]", 
+            "script[src]", "meta[property]", "[id]", "[class]", "[style]", 
+        )
+    }
+
+    _SIMPLE_CSS_TAG: Final[Pattern] = re_compile(r"\*|[A-Za-z_][\w-]*")
+    _SIMPLE_XPATH_TAG: Final[Pattern] = re_compile(r"(\.?//|descendant-or-self::)(\*|[A-Za-z_][\w.-]*)")
+
+    def _simple_select(
+        path: Union[str, XPath], 
+        seltype: Union[int, str, EnumSelectorType], 
+        namespaces: Optional[Mapping], 
+        translator: Union[str, GenericTranslator], 
+    ) -> Optional[Callable[[Element], Iterator[Element]]]:
+        """Helper function to check whether the selector only selects the elements by tag name 
+        (e.g. "p", "*", "//p", ".//p", "descendant-or-self::*"), if so, return a function 
+        that traverses the tree by `tree.iter` (or `tree.iterdescendants` for ".//p"), 
+        which avoids the XPath evaluation."""
+        if not isinstance(path, str) or namespaces:
+            return None
+        path = path.strip()
+        if path == "descendant-or-self::*":
+            return partial(_iter_tag, _element_factory)
+        if EnumSelectorType.of(seltype) is EnumSelectorType.cssselect:
+            if translator != "xml":
+                return None
+            match = _SIMPLE_CSS_TAG.fullmatch(path)
+            axis, tag = "", None if match is None else match[0]
+        else:
+            match = _SIMPLE_XPATH_TAG.fullmatch(path)
+            axis, tag = ("", None) if match is None else match.groups()
+        if tag is None:
+            return None
+        return partial(
+            _iter_descendants_tag if axis == ".//" else _iter_tag, 
+            _element_factory if tag == "*" else tag, 
+        )
+
+    def _iter_tag(tag, tree: Element) -> Iterator[Element]:
+        return tree.iter(tag)
+
+    def _iter_descendants_tag(tag, tree: Element) -> Iterator[Element]:
+        return tree.iterdescendants(tag)
+
+    def _collect(select: Callable[[Element], Iterator[Element]], tree: Element) -> List[Element]:
+        return list(select(tree))
+
     def element_iter(
         path: Union[str, XPath] = "descendant-or-self::*", 
         bc: Optional[BookContainer] = None, 
@@ -977,6 +2043,9 @@ if _LXML_IMPORTED:
         namespaces: Optional[Mapping] = None, 
         translator: Union[str, GenericTranslator] = "xml",
         more_info: bool = False,
+        lazy: bool = False, 
+        reuse_info: bool = False, 
+        **variables, 
     ) -> Union[Generator[Element, None, None], Generator[IterElementInfo, None, None]]:
         """Traverse all (X)HTML files in epub, search the elements that match the path, 
         and return the relevant information of these elements one by one.
@@ -987,7 +2056,8 @@ if _LXML_IMPORTED:
                     If its type is a subclass of "lxml.etree.XPath"`, then 
                     parameters `seltype`, `namespaces`, `translator` are ignored.
         :param bc: `BookContainer` object. 
-            If it is None (the default), will be found in caller's globals().
+            If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
             `BookContainer` object is an object of ePub book content provided by Sigil, 
             which can be used to access and operate the files in ePub.
         :param seltype: Selector type. It can be any value that can be 
@@ -1015,6 +2085,18 @@ if _LXML_IMPORTED:
         :param more_info: Determine whether to wrap the yielding results.
             If false, the yielding results are the match objects of the `path` expression,
             else are the namedtuple `IterElementInfo` objects (with some context information).
+        :param lazy: This parameter only takes effect when `more_info` is False.
+            If true, and the `path` only selects elements by tag name (e.g. "p", "*", "//p"), 
+            the elements will be found by `tree.iter` lazily, instead of collecting all 
+            the matches of each file in advance, it's faster if you stop early. 
+            **NOTE**: Do not remove the yielded elements from the tree during iteration in this case.
+        :param reuse_info: This parameter only takes effect when `more_info` is True.
+            If true, for each file, an object with the same fields as `IterElementInfo` 
+            will be yielded repeatedly and be updated in place, call its `freeze` method 
+            to get a `IterElementInfo` object, if you need to keep it.
+        :param variables: XPath variables, can be referenced as `$name` in the XPath expression. 
+            Passing the runtime values as variables, instead of formatting them into `path`, 
+            keeps `path` unchanged, so the compiled selector is always reused.
 
         :return: Generator, if `more_info` is True, then yield `IterElementInfo` object, 
                 else yield `Element` object.
@@ -1032,36 +2114,138 @@ if _LXML_IMPORTED:
                 # OR equivalent to
                 for element in element_iter(css_selector, bc, more_info=True):
                     operations_on_element(info.element)
+
+                # Use XPath variables
+                for element in element_iter("//meta[@property=$prop]", bc, "xpath", prop="dcterms:modified"):
+                    operations_on_element(element)
         """
-        select: XPath
-        if isinstance(path, str):
-            if EnumSelectorType.of(seltype) is EnumSelectorType.cssselect:
-                select = CSSSelector(
-                    path, namespaces=namespaces, translator=translator)
+        select: Callable
+        iter_select = _simple_select(path, seltype, namespaces, translator)
+        if iter_select is not None:
+            if lazy and not more_info:
+                select = iter_select
             else:
-                select = XPath(path, namespaces=namespaces)
+                select = partial(_collect, iter_select)
+        elif isinstance(path, str):
+            select = _compile_selector(path, seltype, namespaces, translator)
         else:
             select = path
+        if variables and iter_select is None:
+            select = partial(select, **variables)
+        lazy = lazy and not more_info and iter_select is not None
 
         bc = cast(BookContainer, _ensure_bc(bc))
 
-        global_no: int = 0
+        if lazy:
+            for fid, data in edit_html_iter(bc=bc, wrap_me=True): # type: ignore
+                it = select(data["data"])
+                try:
+                    yield next(it)
+                except StopIteration:
+                    data["write_back"] = False
+                    continue
+                yield from it
+            return
+
         data: dict
-        for file_no, (fid, tree) in enumerate(edit_html_iter(bc=bc), 1): # type: ignore
-            href = bc.id_to_href(fid)
-            mime = bc.id_to_mime(fid)
+        if not more_info:
+            for fid, data in edit_html_iter(bc=bc, wrap_me=True): # type: ignore
+                els = select(data["data"])
+                if not els:
+                    data["write_back"] = False
+                    continue
+                yield from els
+            return
+
+        global_no: int = 0
+        # the manifest lookups are only needed to build `IterElementInfo`
+        id_to_href, id_to_mime = _manifest_getters(bc)
+        for file_no, (fid, data) in enumerate(edit_html_iter(bc=bc, wrap_me=True), 1): # type: ignore
+            tree = data["data"]
             els = select(tree)
             if not els:
-                del data["write_back"]
+                data["write_back"] = False
                 continue
-            if more_info:
-                for local_no, (global_no, el) in enumerate(enumerate(els, global_no + 1), 1):
-                    yield IterElementInfo(
-                        bc, fid, local_no, global_no, file_no, href, mime, el, tree)
-            else:
-                yield from els
+            href = id_to_href(fid)
+            mime = id_to_mime(fid)
+            if reuse_info:
+                view = _ElementView(bc, fid, file_no, href, mime, tree)
+                for view.local_no, view.element in enumerate(els, 1):
+                    global_no += 1
+                    view.global_no = global_no
+                    yield view # type: ignore
+                continue
+            for local_no, el in enumerate(els, 1):
+                global_no += 1
+                yield IterElementInfo(
+                    bc, fid, local_no, global_no, file_no, href, mime, el, tree)
 
-    __all__.extend(("IterElementInfo", "EnumSelectorType", "element_iter"))
+    def element_iter_many(
+        paths: Mapping[str, Union[str, XPath]], 
+        bc: Optional[BookContainer] = None, 
+        seltype: Union[int, str, EnumSelectorType] = EnumSelectorType.cssselect, 
+        namespaces: Optional[Mapping] = None, 
+        translator: Union[str, GenericTranslator] = "xml", 
+        **variables, 
+    ) -> Generator[Tuple[str, Element], None, None]:
+        """Traverse all (X)HTML files in epub, search the elements that match each of the paths, 
+        and yield them one by one. For each file, all the paths are evaluated by one 
+        `lxml.etree.XPathEvaluator` object bound to the tree.
+
+        :param paths: A mapping of names to XPath expressions or CSS Selector expressions.
+                    If the type of the expression is `str`, then it is a XPath expression or 
+                    CSS Selector expression determined by `seltype`.
+                    If its type is a subclass of "lxml.etree.XPath"`, then its 
+                    expression (the `path` attribute) is used.
+        :param bc: `BookContainer` object. 
+            If it is None (the default), will use the one set by `set_default_bc`, 
+            or be found in caller's globals().
+            `BookContainer` object is an object of ePub book content provided by Sigil, 
+            which can be used to access and operate the files in ePub.
+        :param seltype: Selector type. It can be any value that can be 
+                        accepted by `EnumSelectorType.of`, the return value called final value.
+                        If its final value is `EnumSelectorType.xpath`, then parameter
+                        `translator` is ignored.
+        :param namespaces: Prefix-namespace mappings used by `paths`.
+        :param translator: A CSS Selector expression to XPath expression translator object.
+        :param variables: XPath variables, can be referenced as `$name` in the XPath expressions.
+
+        :return: Generator, yield 2-tuples of (name of the path, `Element` object).
+
+        :Examples:
+
+            .. code-block:: python
+
+                for name, el in element_iter_many({"img": "img", "link": "a[href]"}):
+                    print(name, el)
+        """
+        exprs: List[Tuple[str, str]] = [
+            (name, (_compile_selector(path, seltype, namespaces, translator) 
+                    if isinstance(path, str) else path).path)
+            for name, path in paths.items()
+        ]
+
+        bc = cast(BookContainer, _ensure_bc(bc))
+
+        for fid, data in edit_html_iter(bc=bc, wrap_me=True): # type: ignore
+            evaluator = XPathEvaluator(data["data"], namespaces=namespaces)
+            found = False
+            for name, expr in exprs:
+                result = evaluator(expr, **variables)
+                if isinstance(result, list):
+                    for el in result:
+                        found = True
+                        yield name, el
+                else:
+                    found = True
+                    yield name, result
+            if not found:
+                data["write_back"] = False
+
+    __all__.extend((
+        "IterElementInfo", "EnumSelectorType", "compiled_xpath", "compiled_css", 
+        "element_iter", "element_iter_many", 
+    ))
 
 
 class EditCache(MutableMapping[str, T]):
@@ -1077,8 +2261,11 @@ class EditCache(MutableMapping[str, T]):
 
     **NOTE**: If you need to directly operate on the corresponding `bookcontainer.Bookcontainer` object (e.g., delete a file), please clear this editcache first.
 
+    **NOTE**: The opened files will not be written back when this object is garbage collected, please use it as a context manager, or call the `close` (alias of `clear`) method manually.
+
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
 
@@ -1102,31 +2289,39 @@ class EditCache(MutableMapping[str, T]):
         bc = cast(BookContainer, _ensure_bc(bc))
         self._exit_cbs: Dict[str, Tuple[ContextManager, Callable]]= {}
         self._data: Dict[str, T] = {}
+        # The manifest ids of the files that need to be written back
+        self._dirty: Set[str] = set()
+        self._data_proxy: MappingProxyType = MappingProxyType(self._data)
         self._bc: BookContainer = bc
+        # Internal `BookContainer` object (as plain attributes, for fast access). 
+        # `BookContainer` object is an object of ePub book content provided by Sigil, 
+        # which can be used to access and operate the files in ePub.
+        self.bookcontainer: BookContainer = bc
+        self.bc = self.bk = bc
 
     @contextmanager
     def _cm(self, fid: str, bc: BookContainer, /) -> Generator[T, None, None]:
         with type(self).__context_factory__(fid, bc) as data:
             yield data
-            if fid in self._data:
+            if fid in self._data and self._is_dirty(fid):
                 raise WriteBack(self._data[fid])
             else:
                 raise DoNotWriteBack
 
+    def _is_dirty(self, fid: str, /) -> bool:
+        return fid in self._dirty
+
+    def mark_dirty(self, fid) -> None:
+        """Mark the opened file of the manifest id `fid` as modified, so that 
+        it will be written back, otherwise raise `KeyError`."""
+        if fid not in self._data:
+            raise KeyError(fid)
+        self._dirty.add(fid)
+
     @property
     def data(self) -> MappingProxyType:
         """A dictionary as a set of [file's manifest id]: [file data object] pairs."""
-        return MappingProxyType(self._data)
-
-    @property
-    def bookcontainer(self) -> BookContainer:
-        """Internal `BookContainer` object. 
-        `BookContainer` object is an object of ePub book content provided by Sigil, 
-        which can be used to access and operate the files in ePub.
-        """
-        return self._bc
-
-    bc = bk = bookcontainer
+        return self._data_proxy
 
     def __contains__(self, fid):
         "Determine whether `fid` is an available manifest id."
@@ -1207,13 +2402,14 @@ class EditCache(MutableMapping[str, T]):
             return received_exc and suppressed_exc
         finally:
             self._data.clear()
+            self._dirty.clear()
             self._exit_cbs.clear()
 
     def clear(self) -> None:
         "Write all opened files back, and clear the `EditCache` object."
         self.__exit__(*sys.exc_info())
 
-    __del__ = clear
+    close = clear
 
     def __getitem__(self, fid) -> T:
         """Receive a file's manifest id `fid`, return the corresponding 
@@ -1221,10 +2417,9 @@ class EditCache(MutableMapping[str, T]):
         data = self._data
         if fid not in data:
             try:
-                cm = type(self)._cm(self, fid, self._bc)
-                cm_type = type(cm)
-                data[fid] = cm_type.__enter__(cm) # type: ignore
-                self._exit_cbs[fid] = (cm, cm_type.__exit__)
+                cm = self._cm(fid, self._bc)
+                data[fid] = cm.__enter__()
+                self._exit_cbs[fid] = (cm, type(cm).__exit__)
             except Exception as exc:
                 raise KeyError(fid) from exc
         return data[fid]
@@ -1243,12 +2438,14 @@ class EditCache(MutableMapping[str, T]):
                 "The data type does not match. It must be the same as the data type of "
                 "the original data, expected %r, got %r." % (original_type, data_type))
         self._data[fid] = data
+        self._dirty.add(fid)
 
     def __delitem__(self, fid) -> None:
         """If the manifest id `fid` available and the corresponding data were modified, 
         then clear the modified data."""
         if fid in self._data:
             del self._data[fid]
+            self._dirty.discard(fid)
             cm, cm_exit = self._exit_cbs.pop(fid)
             try:
                 raise DoNotWriteBack
@@ -1300,10 +2497,19 @@ class TextEditCache(EditCache[T]):
 
     **NOTE**: If you need to directly operate on the corresponding `bookcontainer.Bookcontainer` object (e.g., delete a file), please clear this editcache first.
 
+    **NOTE**: The opened files will not be written back when this object is garbage collected, please use it as a context manager, or call the `close` (alias of `clear`) method manually.
+
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `set_default_bc`, 
+        or be found in caller's globals().
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
+    :param workers: If it is greater than 1, the opened etrees will be serialized 
+        in a thread pool with this many worker threads before writing back.
+    :param track_dirty: If False (the default), all the opened etrees will be written back 
+        (if changed), because they may be modified in place. 
+        If True, only the etrees set by `__setitem__` or marked by `mark_dirty` will 
+        be serialized and written back, others are discarded.
 
     :Examples:
 
@@ -1318,17 +2524,74 @@ class TextEditCache(EditCache[T]):
     """
     __context_factory__: Callable[[str, BookContainer], ContextManager] = ctx_edit_html
 
+    def __init__(
+        self, 
+        bc: Optional[BookContainer] = None, 
+        workers: int = 1, 
+        track_dirty: bool = False, 
+    ) -> None:
+        super().__init__(_ensure_bc(bc))
+        self._workers = workers
+        self._track_dirty = track_dirty
+        # The manifest ids of text files (as keys of a dict, which keeps the order), 
+        # cached on first use and discarded in `__exit__`
+        self._text_ids: Optional[Dict[str, None]] = None
+
+    def _get_text_ids(self) -> Dict[str, None]:
+        text_ids = self._text_ids
+        if text_ids is None:
+            text_ids = self._text_ids = dict.fromkeys(
+                fid for fid, *_ in self._bc.text_iter())
+        return text_ids
+
+    def _serialize_all(self) -> None:
+        """Serialize all the opened etrees in advance (in a thread pool, if `workers` > 1), 
+        so that writing back only needs to compare and write the strings one by one. 
+        If an etree failed to be serialized, it will be kept, and the error will be 
+        raised when writing back."""
+        data = self._data
+        get_mime = _manifest_getters(self._bc)[1]
+
+        def serialize(item: Tuple[str, Any]) -> Tuple[str, Optional[str]]:
+            fid, tree = item
+            try:
+                return fid, _html_serializer(get_mime(fid, ""))(tree)
+            except Exception:
+                return fid, None
+
+        is_dirty = self._is_dirty
+        items = [item for item in data.items() if is_dirty(item[0])]
+        results: Iterable[Tuple[str, Optional[str]]]
+        if self._workers > 1 and len(items) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(self._workers) as executor:
+                results = list(executor.map(serialize, items))
+        else:
+            results = map(serialize, items)
+        for fid, content in results:
+            if content is not None:
+                data[fid] = content # type: ignore
+
+    def _is_dirty(self, fid: str, /) -> bool:
+        return not self._track_dirty or fid in self._dirty
+
+    def __exit__(self, *exc_info):
+        self._text_ids = None
+        if exc_info[0] is None and self._data:
+            self._serialize_all()
+        return super().__exit__(*exc_info)
+
     def __contains__(self, fid):
         "Determine whether `fid` is an available manifest id."
-        return fid in iter(self)
+        return fid in self._get_text_ids()
 
     def __len__(self) -> int:
         """Count of all available [files" manifest ids] (HTML / XHTML only)."""
-        return sum(1 for _ in self._bc.text_iter())
+        return len(self._get_text_ids())
 
     def __iter__(self) -> Iterator[str]:
         """Iterate over all available [files" manifest ids] (HTML / XHTML only)
         (from `bookcontainer.Bookcontainer.text_iter`)."""
-        for fid, *_ in self._bc.text_iter():
-            yield fid
+        return iter(self._get_text_ids())
 
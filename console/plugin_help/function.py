@@ -12,24 +12,16 @@ __all__ = [
 
 import builtins
 import re
-import subprocess
 import sys
 
 from contextlib import contextmanager
-from copy import deepcopy
-from os import _exit, path as _path, environ
-from os.path import abspath
-from pickle import load as pickle_load, dump as pickle_dump
-from runpy import run_path
-from tempfile import NamedTemporaryFile
-from traceback import print_exc
+from copy import copy, deepcopy
+from functools import lru_cache
+from os import _exit, environ, stat
+from os.path import abspath, dirname, exists, isdir, join
+from pickle import load as pickle_load, dump as pickle_dump, HIGHEST_PROTOCOL
+from traceback import format_exception
 from typing import cast, Final, Iterable, Mapping, Optional
-from zipfile import ZipFile
-
-try:
-    from lxml.etree import parse as parse_xml_file # type: ignore
-except ImportError:
-    from xml.etree.ElementTree import parse as parse_xml_file
 
 try:
     from wrapper import Wrapper # type: ignore
@@ -40,13 +32,23 @@ try:
 except ImportError:
     pass
 
+import plugin_help as _plugin_help
+
 from plugin_util.colored import colored
 from plugin_util.dictattr import DictAttr
-from plugin_util.run import ctx_load, run_file
-from plugin_util.temporary import temp_list
 
 
-_SYSTEM_IS_WINDOWS: Final[bool] = __import__("platform").system() == "Windows"
+_SYSTEM_IS_WINDOWS: Final[bool] = sys.platform == "win32"
+# The site prefixes, they will not be cleaned after running a plugin, see `_run_plugin`
+_SITE_PREFIXES: Final[frozenset[str]] = frozenset(__import__('site').PREFIXES)
+# Buffer size of the file to dump / load the wrapper
+_DUMP_BUFSIZE: Final[int] = 1 << 20
+# Find the plugin type in the head of plugin.xml, without parsing the whole file
+_PLUGIN_TYPE_PATTERN: Final[re.Pattern] = re.compile(rb'<type>\s*([^<\s]+)')
+# Banners for the results of the startup scripts, see `_startup`
+_BANNER_APPENDED: Final[str] = colored('◉ APPENDED', 'yellow', attrs=['bold', 'blink'])
+_BANNER_LOADED: Final[str] = colored('◉ LOADED', 'green', attrs=['bold', 'blink'])
+_BANNER_ERROR: Final[str] = colored('◉ ERROR', 'red', attrs=['bold', 'blink'])
 
 
 def abort() -> None:
@@ -64,28 +66,75 @@ def exit() -> None:
 def dump_wrapper(wrapper: Optional[Wrapper] = None) -> None:
     "Dump wrapper to file."
     if wrapper is None:
-        wrapper = __import__("plugin_help").WRAPPER
-    pickle_dump(wrapper, open(environ["PLUGIN_DUMP_FILE"], "wb"))
+        wrapper = _plugin_help.WRAPPER
+    with open(environ["PLUGIN_DUMP_FILE"], "wb", buffering=_DUMP_BUFSIZE) as f:
+        pickle_dump(wrapper, f, protocol=HIGHEST_PROTOCOL)
 
 
 def load_wrapper() -> Wrapper:
     "Load wrapper from file."
-    wrapper = pickle_load(open(environ["PLUGIN_DUMP_FILE"], "rb"))
-    __import__("plugin_help").WRAPPER = wrapper
+    with open(environ["PLUGIN_DUMP_FILE"], "rb", buffering=_DUMP_BUFSIZE) as f:
+        wrapper = pickle_load(f)
+    _plugin_help.WRAPPER = wrapper
     return wrapper
 
 
 @contextmanager
-def _ctx_wrapper():
-    dump_wrapper()
-    yield __import__("plugin_help").WRAPPER
-    load_wrapper()
+def _ctx_wrapper(inprocess: bool = False):
+    """The resulting wrapper (after running a plugin or console) will be set to 
+    `plugin_help.WRAPPER`. By default the wrapper is passed to (and back from) the 
+    child process by the dump file. If `inprocess` is True, the plugin runs in the 
+    current process and sets it directly, so the dump file is not touched."""
+    if inprocess:
+        wrapper = _plugin_help.WRAPPER
+        try:
+            yield wrapper
+        except BaseException:
+            _plugin_help.WRAPPER = wrapper
+            raise
+    else:
+        dump_wrapper()
+        yield _plugin_help.WRAPPER
+        load_wrapper()
+
+
+# Types of the immutable values, which can be shared by the copies
+_ATOMIC_TYPES: Final[frozenset] = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _copy_plain(obj):
+    """Copy the nested built-in containers (dict, list, tuple, set), and share 
+    the immutable values, other objects are copied by `copy.deepcopy`."""
+    cls = type(obj)
+    if cls in _ATOMIC_TYPES:
+        return obj
+    elif cls is dict:
+        return {k: v if type(v) in _ATOMIC_TYPES else _copy_plain(v) for k, v in obj.items()}
+    elif cls is list:
+        return [v if type(v) in _ATOMIC_TYPES else _copy_plain(v) for v in obj]
+    elif cls is tuple:
+        if all(type(v) in _ATOMIC_TYPES for v in obj):
+            return obj
+        return tuple(map(_copy_plain, obj))
+    elif cls is set:
+        return set(obj)
+    return deepcopy(obj)
+
+
+def _copy_wrapper(wrapper: Wrapper) -> Wrapper:
+    """Copy the wrapper for a plugin to modify. The attributes of the wrapper are mostly 
+    the mappings and lists of strings, so it only copies the containers, which is much 
+    faster than `copy.deepcopy`."""
+    wrapper_new = copy(wrapper)
+    for name, value in vars(wrapper).items():
+        setattr(wrapper_new, name, _copy_plain(value))
+    return wrapper_new
 
 
 def get_container(wrapper=None) -> Mapping:
     "Get the sigil containers."
     if wrapper is None:
-        wrapper = __import__("plugin_help").WRAPPER
+        wrapper = _plugin_help.WRAPPER
     return DictAttr(
         wrapper    = wrapper, 
         edit       = BookContainer(wrapper), 
@@ -95,14 +144,33 @@ def get_container(wrapper=None) -> Mapping:
     )
 
 
-def run_env(forcible_execution: bool = False, /) -> None:
-    'Run env.py, to inject some configuration and global variables'
+def run_env(
+    forcible_execution: bool = False, 
+    /, 
+    globals: Optional[dict] = None, 
+) -> None:
+    '''Run env.py, to inject some configuration and global variables
+
+    :param forcible_execution: Whether to execute even if the environment had been loaded.
+    :param globals: The global namespace used to execute. 
+        If it is None (the default), the caller's globals() will be used.
+    '''
     if forcible_execution:
-        try:
-            delattr(__import__("builtins"), "PLUGIN_SETTING")
-        except AttributeError:
-            pass
-    run_file(environ["PLUGIN_STARTUP_FILE"], sys._getframe(1).f_globals)
+        _plugin_help.set_settings(None)
+    from plugin_util.run import run_file
+
+    if globals is None:
+        globals = sys._getframe(1).f_globals
+    run_file(environ["PLUGIN_STARTUP_FILE"], globals)
+
+
+@lru_cache(maxsize=128)
+def _zip_has_main(path: str, mtime_ns: int, /) -> bool:
+    "Determine whether the .zip file has __main__.py (cached by path and modification time)."
+    from zipfile import ZipFile
+
+    with ZipFile(path) as zf:
+        return '__main__.py' in zf.NameToInfo
 
 
 def load_script(
@@ -111,7 +179,6 @@ def load_script(
     include_single: bool = False, 
     include__dunder: bool = False, 
     include__special__: bool = False, 
-    _cre=re.compile('^(?P<special>__.+__)|(?P<dunder>__.*)|(?P<single>_.*)|(?P<normal>.*)$', re.S | re.U), 
 ) -> Optional[dict]:
     '''To execute or register some script.
 
@@ -130,37 +197,42 @@ def load_script(
     TIPS: It will deal with the following situations separately:
         1. A file (e.g., suffixed by .py or .pyz), or a folder (or a .zip file) 
            with __main__.py, will be executed directly.
-        2. A folder (or .zip file) without __main__.py will be appended to sys.path.
+        2. A folder (or .zip file) without __main__.py will be appended to sys.path 
+           (as an absolute path, if it is not in sys.path).
     Tips: In the result dictionary of the script (result is the return value of `runpy.run_path`), 
           all the key-value pairs, their keys are not excluded and their values are different from 
           those of the same key in `globals`, were updated to `globals`.
     '''
-    if not _path.exists(path):
+    if not exists(path):
         raise FileNotFoundError('No such file or directory: %r' % path)
 
     as_sys_path: bool = False
-    if _path.isdir(path):
-        as_sys_path = not _path.exists(_path.join(path, '__main__.py'))
+    if isdir(path):
+        as_sys_path = not exists(join(path, '__main__.py'))
     elif path.endswith('.zip'):
-        as_sys_path = '__main__.py' not in ZipFile(path).NameToInfo
+        as_sys_path = not _zip_has_main(path, stat(path).st_mtime_ns)
 
     if as_sys_path:
-        sys.path.append(path)
+        # Loading the same package repeatedly should not make `sys.path` grow
+        path = abspath(path)
+        if path not in sys.path:
+            sys.path.append(path)
         return None
 
     if globals is None:
         globals = sys._getframe(1).f_globals
 
     def check_group(name):
-        group = _cre.fullmatch(name).lastgroup
-        if group == 'single':
+        if not name.startswith('_'):
+            return True
+        elif not name.startswith('__'):
             return include_single
-        elif group == 'dunder':
-            return include__dunder
-        elif group == 'special':
+        elif len(name) > 4 and name.endswith('__'):
             return include__special__
         else:
-            return True
+            return include__dunder
+
+    from runpy import run_path
 
     sentinel = object()
     ret: dict = cast(dict, run_path(path, globals, '__main__'))
@@ -183,37 +255,45 @@ def _startup(
     namespace: Optional[dict] = None, 
     startups: Optional[Iterable[str]] = None, 
     errors: Optional[str] = None, 
+    traceback_limit: Optional[int] = None, 
 ) -> dict:
     if namespace is None:
         namespace = {}
 
     if startups is None:
-        startups = cast(tuple[str], tuple(PLUGIN_SETTING["config"].get("startup", ())))
+        startups = cast(tuple[str], tuple(_plugin_help.SETTINGS["config"].get("startup", ())))
     else:
         startups = cast(tuple[str], tuple(startups))
     if not startups:
         return namespace
 
     if errors is None:
-        errors = cast(str, str(PLUGIN_SETTING["config"].get("errors", "ignore")))
+        errors = cast(str, str(_plugin_help.SETTINGS["config"].get("errors", "ignore")))
+
+    if traceback_limit is None:
+        # Only print the innermost frames of the traceback (without the chained exceptions)
+        traceback_limit = int(_plugin_help.SETTINGS["config"].get("traceback_limit", 10))
 
     success_count: int = 0
     error_count: int = 0
     keys_updated: set = set()
+    write = sys.stdout.write
     for i, path in enumerate(startups, 1):
         try:
             ret = load_script(path, namespace)
             if ret is None:
-                print(colored('◉ APPENDED', 'yellow', attrs=['bold', 'blink']), '➜', i, path)
+                write(f'{_BANNER_APPENDED} ➜ {i} {path}\n')
             else:
                 keys_updated |= ret.keys()
-                print(colored('◉ LOADED', 'green', attrs=['bold', 'blink']), '➜', i, path)
+                write(f'{_BANNER_LOADED} ➜ {i} {path}\n')
             success_count += 1
-        except BaseException:
-            print(colored('◉ ERROR', 'red', attrs=['bold', 'blink']), '➜', i, path)
+        except BaseException as exc:
+            write(f'{_BANNER_ERROR} ➜ {i} {path}\n')
             if errors == 'raise':
                 raise
-            print_exc()
+            sys.stdout.flush()
+            sys.stderr.write(''.join(format_exception(
+                type(exc), exc, exc.__traceback__, limit=-traceback_limit, chain=False)))
             if errors == 'stop':
                 print(colored(
                     '🤗 %s SUCCESSES, 🤯 AN ERROR OCCURRED, 🤕 SKIPPING THE REMAINING %s STARTUPS' 
@@ -239,24 +319,43 @@ def _startup(
     return namespace
 
 
+def _parse_xml_file(path: str):
+    "Parse a XML file, by `lxml` if it is available."
+    try:
+        from lxml.etree import parse # type: ignore
+    except ImportError:
+        from xml.etree.ElementTree import parse
+    return parse(path)
+
+
 def _run_plugin(file_or_dir: str, bc: BookContainer):
-    container = get_container(deepcopy(bc._w))
+    from plugin_util.run import ctx_load
+    from plugin_util.temporary import temp_list
+
+    paths = _plugin_help.SETTINGS["path"]
+    container = get_container(_copy_wrapper(bc._w))
 
     target_dir: str
     target_file: str
-    if _path.isdir(file_or_dir):
+    if isdir(file_or_dir):
         target_dir = file_or_dir
-        target_file = _path.join(file_or_dir, 'plugin.py')
+        target_file = join(file_or_dir, 'plugin.py')
     else:
         target_file = file_or_dir
-        target_dir = _path.dirname(target_file)
+        target_dir = dirname(target_file)
 
+    xml_path = join(target_dir, 'plugin.xml')
     try:
-        et = parse_xml_file(_path.join(target_dir, 'plugin.xml'))
+        with open(xml_path, 'rb') as f:
+            head = f.read(4096)
     except FileNotFoundError:
         plugin_type = 'edit'
     else:
-        plugin_type = et.findtext('type', 'edit')
+        match = _PLUGIN_TYPE_PATTERN.search(head)
+        if match is not None:
+            plugin_type = match[1].decode('utf-8')
+        else:
+            plugin_type = _parse_xml_file(xml_path).findtext('type', 'edit')
 
     if plugin_type not in ('edit', 'input', 'validation', 'output'):
         raise ValueError(
@@ -267,66 +366,206 @@ def _run_plugin(file_or_dir: str, bc: BookContainer):
             target_file, 
             wdir=target_dir, 
             prefixes_not_clean=(
-                *set(__import__('site').PREFIXES), 
-                PLUGIN_SETTING["path"]['sigil_package_dir'], 
+                *_SITE_PREFIXES, 
+                paths['sigil_package_dir'], 
             ), 
         ) as mod, \
         temp_list(sys.argv) as av, \
-        _ctx_wrapper() \
+        _ctx_wrapper(inprocess=True) \
     :
         sys.modules['__main__'] = __import__('launcher')
         sys.modules[getattr(mod, '__name__')] = mod
-        av[:] = [PLUGIN_SETTING["path"]['laucher_file'], 
-                 PLUGIN_SETTING["path"]['ebook_root'], 
-                 PLUGIN_SETTING["path"]['outdir'], 
+        av[:] = [paths['laucher_file'], 
+                 paths['ebook_root'], 
+                 paths['outdir'], 
                  plugin_type, target_file]
 
         bk = container[plugin_type]
-        try:
-            ret = getattr(mod, 'run')(bk)
-            if ret == 0 or type(ret) is not int:
-                dump_wrapper(bk._w)
-            else:
-                # Restore to unmodified (no guarantee of right result)
-                dump_wrapper(bc._w)
-        except BaseException:
+        ret = getattr(mod, 'run')(bk)
+        if ret == 0 or type(ret) is not int:
+            _plugin_help.WRAPPER = bk._w
+        else:
             # Restore to unmodified (no guarantee of right result)
-            dump_wrapper(bc._w)
-            raise
+            _plugin_help.WRAPPER = _copy_wrapper(bc._w)
         return ret
 
 
+def _startup_exec_source() -> str:
+    "The source code for a child process to execute the startup file."
+    startup_file = environ["PLUGIN_STARTUP_FILE"]
+    return f'''\
+# Execute the startup file, prefer its compiled code (see `plugin_run.run`), 
+# if it is not stale (checked like the import system does)
+try:
+    with open({startup_file + "c"!r}, "rb") as _f:
+        _code = _f.read()
+    _st = __import__("os").stat({startup_file!r})
+    if (
+        _code[:4] != __import__("importlib.util").util.MAGIC_NUMBER
+        or _code[4:8] != bytes(4)
+        or int.from_bytes(_code[8:12], "little") != int(_st.st_mtime) & 0xFFFFFFFF
+        or int.from_bytes(_code[12:16], "little") != _st.st_size & 0xFFFFFFFF
+    ):
+        raise ValueError
+    _code = __import__("marshal").loads(_code[16:])
+except (OSError, ValueError, EOFError):
+    _code = open({startup_file!r}, encoding="utf-8").read()
+exec(_code, globals())
+del _code
+'''
+
+
+# The source code of the worker process, which runs the plugins repeatedly, 
+# see `_PluginWorker`
+_PLUGIN_WORKER_SOURCE: Final[str] = '''
+# The worker must not overwrite the dump file at exit
+__import__("atexit").unregister(plugin.dump_wrapper)
+
+from multiprocessing.connection import Client as _Client
+
+_conn = _Client(
+    ("127.0.0.1", int(__import__("os").environ["SIGIL_CONSOLE_WORKER_PORT"])), 
+    authkey=bytes.fromhex(__import__("os").environ["SIGIL_CONSOLE_WORKER_AUTHKEY"]), 
+)
+while True:
+    try:
+        _msg = _conn.recv()
+    except EOFError:
+        break
+    if _msg is None:
+        break
+    _file_or_dir, plugin.WRAPPER = _msg
+    bc = bk = __import__("bookcontainer").BookContainer(plugin.WRAPPER)
+    try:
+        _ret = plugin.function._run_plugin(_file_or_dir, bc)
+        print("plugin %r \\n\\t |_ return ➜ %r" % (_file_or_dir, _ret))
+        try:
+            _conn.send((True, _ret, plugin.WRAPPER))
+        except Exception:
+            _conn.send((True, None, plugin.WRAPPER))
+    except BaseException as _exc:
+        __import__("traceback").print_exc()
+        _conn.send((False, "%s: %s" % (type(_exc).__qualname__, _exc), None))
+_conn.close()
+'''
+
+
+class _PluginWorker:
+    """A long-lived child process, which runs the plugins one by one (see `run_plugin`), 
+    so that the interpreter startup and the startup file are only paid once."""
+    __slots__ = ("executable", "process", "conn")
+
+    def __init__(self, executable: str = sys.executable):
+        import subprocess
+        from multiprocessing.connection import Listener
+        from os import urandom
+        from threading import Thread
+
+        self.executable = executable
+        authkey = urandom(16)
+        with Listener(("127.0.0.1", 0), authkey=authkey) as listener:
+            env = dict(environ)
+            env["SIGIL_CONSOLE_WORKER_PORT"] = str(listener.address[1])
+            env["SIGIL_CONSOLE_WORKER_AUTHKEY"] = authkey.hex()
+            dump_wrapper()
+            self.process = subprocess.Popen(
+                [executable, "-c", _startup_exec_source() + _PLUGIN_WORKER_SOURCE], env=env)
+            # Wait for the connection, but give up if the child process exits
+            accepted: list = []
+            thread = Thread(target=lambda: accepted.append(listener.accept()), daemon=True)
+            thread.start()
+            while thread.is_alive() and self.process.poll() is None:
+                thread.join(0.1)
+            thread.join(0.1)
+        if not accepted:
+            self.process.kill()
+            raise RuntimeError("failed to start the plugin worker process")
+        self.conn = accepted[0]
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, file_or_dir: str, wrapper: Wrapper):
+        "Run the plugin in the worker process, return the (resulting wrapper, return value)."
+        self.conn.send((file_or_dir, wrapper))
+        success, ret, wrapper_new = self.conn.recv()
+        if not success:
+            raise RuntimeError("failed to run plugin %r in the worker process: %s" % (file_or_dir, ret))
+        return wrapper_new, ret
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+            self.conn.close()
+            self.process.wait(5)
+        except Exception:
+            self.process.kill()
+
+
+# The worker process for `run_plugin(..., reuse_process=True)`
+_plugin_worker: Optional[_PluginWorker] = None
+
+
+def _get_plugin_worker(executable: str = sys.executable) -> _PluginWorker:
+    global _plugin_worker
+    worker = _plugin_worker
+    if worker is not None:
+        if worker.executable == executable and worker.is_alive():
+            return worker
+        worker.close()
+    else:
+        __import__("atexit").register(lambda: _plugin_worker and _plugin_worker.close())
+    worker = _plugin_worker = _PluginWorker(executable)
+    return worker
+
+
 def run_plugin(
     file_or_dir: str, 
     bc: Optional[BookContainer] = None,
     run_in_process: bool = False,
     executable: str = sys.executable,
+    reuse_process: bool = False, 
 ):
     '''Running a Sigil plug-in
 
     :param file_or_dir: Path of Sigil plug-in folder or script file.
     :param bc: `BookContainer` object. 
-        If it is None (the default), will be found in caller's globals().
+        If it is None (the default), will use the one set by `editor.set_default_bc`, 
+        or be found in caller's globals(), or be created from `plugin_help.WRAPPER`.
+        Passing it explicitly avoids the lookups.
         `BookContainer` object is an object of ePub book content provided by Sigil, 
         which can be used to access and operate the files in ePub.
     :param run_in_process: Determine whether to run the program in a child process.
-
-    :return: If `run_in_process` is True, return `subprocess.CompletedProcess`, else 
+    :param executable: The Python executable to start the child process.
+    :param reuse_process: This parameter only takes effect when `run_in_process` is True.
+        If True, the plugin will be run in a long-lived child process (started on first use), 
+        which is reused by the subsequent calls, so the interpreter startup and the 
+        startup file are only paid once.
+
+    :return: If `run_in_process` is True (and `reuse_process` is False), 
+             return `subprocess.CompletedProcess`, else 
              return the return value of the plugin function.
     '''
-    if not _path.exists(file_or_dir):
+    if not exists(file_or_dir):
         raise FileNotFoundError('No such file or directory: %r' % file_or_dir)
 
-    file_or_dir = _path.abspath(file_or_dir)
+    file_or_dir = abspath(file_or_dir)
+
+    if run_in_process and reuse_process:
+        _plugin_help.WRAPPER, ret = _get_plugin_worker(executable).run(
+            file_or_dir, _plugin_help.WRAPPER)
+        return ret
+    elif run_in_process:
+        import subprocess
+        from tempfile import NamedTemporaryFile
 
-    if run_in_process:
-        with NamedTemporaryFile(suffix='.py', mode='w', encoding='utf-8') as f, _ctx_wrapper():
+        with NamedTemporaryFile(suffix='.py', mode='w', encoding='utf-8') as f, \
+                _ctx_wrapper():
             f.write(
 f'''#!/usr/bin/env python3
 # coding: utf-8
 
-exec(open({environ["PLUGIN_STARTUP_FILE"]!r}, encoding="utf-8").read(), globals())
-
+{_startup_exec_source()}
 try:
     retcode = __import__("plugin_help").function._run_plugin({file_or_dir!r}, bc)
     print("plugin %r \\n\\t |_ return ➜ %r" % (r'{file_or_dir}', retcode))
@@ -344,11 +583,16 @@ if retcode != 0:
                 [executable, f.name], 
                 check=True, shell=_SYSTEM_IS_WINDOWS)
     else:
+        if bc is None:
+            # Do not import the editor module just for this
+            editor = sys.modules.get('plugin_help.editor')
+            if editor is not None:
+                bc = editor._bc_ctx.get()
         if bc is None:
             try:
                 bc = cast(BookContainer, sys._getframe(1).f_globals['bc'])
             except KeyError:
-                bc = cast(BookContainer, _EDIT_CONTAINER)
+                bc = BookContainer(_plugin_help.WRAPPER)
 
         return _run_plugin(file_or_dir, bc)
 
@@ -9,23 +9,92 @@ __all__ = ["run"]
 
 from contextlib import contextmanager
 from copy import deepcopy
+from functools import lru_cache
 from importlib import import_module
 from os import chdir, environ, path as os_path
+from string import Template
 from typing import Final, Optional
 
 from plugin_util.run import run_in_process
-from plugin_help.console import CONSOLE_MAP
+from plugin_help.console import CONSOLE_MAP_RO, warm_console_caches
 
 
 _IS_MACOS = __import__("platform").system() == "Darwin"
 MUDULE_DIR: Final[str] = os_path.dirname(os_path.abspath(__file__))
 CONFIG_JSON_FILE: Final[str] = os_path.join(MUDULE_DIR, "config.json")
 
+# The template of the startup file, see `run`
+_STARTUP_TEMPLATE: Final[Template] = Template("""\
+#!/usr/bin/env python3
+# coding: utf-8
+
+__import__("warnings").filterwarnings("ignore", category=DeprecationWarning)
+
+if getattr(__import__("sys").modules.get("plugin_help"), "SETTINGS", None) is not None:
+    if __name__ != "__init__":
+        # Execution success information
+        print('''
+    🦶🦶🦶 Environment had been loaded, ignoring
+''')
+else:
+    # Changing working directory
+    __import__("os").chdir($outdir)
+
+    # Setting os.environ
+    __import__("os").environ.update($env)
+
+    # Injecting module paths
+    if $sigil_package_dir not in __import__("sys").path:
+        __import__("sys").path[:0] = [$sigil_package_dir, $this_plugin_dir]
 
+    # Introducing global variables
+    import plugin_help as plugin
+    from plugin_help import editor
+    bc = bk = __import__("bookcontainer").BookContainer(plugin.load_wrapper())
+
+    # Introducing the settings: PLUGIN_SETTING (also as `plugin_help.SETTINGS`)
+    from types import MappingProxyType
+    PLUGIN_SETTING = MappingProxyType({
+        "config": MappingProxyType($config), 
+        "path": MappingProxyType($paths), 
+        "env": MappingProxyType($env), 
+    })
+    plugin.set_settings(PLUGIN_SETTING)
+    del MappingProxyType
+
+    # Perform startup scripts
+    if __name__ == "__main__":
+        plugin.function._startup(globals())
+
+    # Callback at exit
+    __import__("atexit").register(plugin.dump_wrapper)
+
+    # Wrapped exit function for idlelib
+    try:
+        if isinstance(exit, __import__("_sitebuiltins").Quitter):
+            @staticmethod
+            @__import__("functools").wraps(exit)
+            def exit(*args, _exit=exit):
+                plugin.dump_wrapper()
+                _exit()
+            exit = type("", (), {"__repr__": lambda self: self(), "__call__": exit})()
+    except (NameError, ImportError):
+        pass
+
+    if __name__ != "__init__":
+        # Execution success information
+        print('''
+    🎉🎉🎉 Environment loaded successfully
+''')
+""")
+
+
+@lru_cache(maxsize=None)
 def _import_all(mod_name):
-    mod = import_module(mod_name)
-    get = mod.__dict__.get
-    return {k: get(k) for k in mod.__all__}
+    "Get the names (in `__all__`) of the module, the result is cached, do not modify it."
+    mod = __import__("sys").modules.get(mod_name) or import_module(mod_name)
+    ns = vars(mod)
+    return {k: ns.get(k) for k in mod.__all__}
 
 
 @contextmanager
@@ -77,8 +146,8 @@ def update_config_gui_tk(
         config.update(config_new)
         return config
     else:
-        namespace = _import_all("plugin_util.tkinter_extensions")
-        namespace.update(config=config, CONSOLES=list(CONSOLE_MAP))
+        namespace = dict(_import_all("plugin_util.tkinter_extensions"))
+        namespace.update(config=config, CONSOLES=list(CONSOLE_MAP_RO))
 
         tkapp = TkinterXMLConfigParser(
             os_path.join(MUDULE_DIR, "plugin_src", "config.xml"), namespace)
@@ -92,99 +161,62 @@ def update_config_gui_qt(new_process: bool = _IS_MACOS) -> dict:
 
 def run(bc) -> Optional[int]:
     with _ctx_conifg(bc) as config:
+        # Warm the file caches of the last used console while the user is configuring
+        warm_console_caches(config["config"]["console"])
         config = update_config_gui_tk(config)["config"]
 
+    dirname, join = os_path.dirname, os_path.join
     laucher_file, ebook_root, outdir, _, target_file = __import__("sys").argv
-    this_plugin_dir = os_path.dirname(target_file)
-    sigil_package_dir = os_path.dirname(laucher_file)
+    this_plugin_dir = dirname(target_file)
+    sigil_package_dir = dirname(laucher_file)
 
     paths = dict(
         laucher_file      = laucher_file,
         sigil_package_dir = sigil_package_dir,
         this_plugin_dir   = this_plugin_dir,
-        plugins_dir       = os_path.dirname(this_plugin_dir),
+        plugins_dir       = dirname(this_plugin_dir),
         ebook_root        = ebook_root,
         outdir            = outdir,
     )
 
     env = {}
     env["PLUGIN_OUTDIR"]       = outdir
-    env["PLUGIN_DUMP_FILE"]    = os_path.join(outdir, "sigil_console.dump.pkl")
-    env["PLUGIN_ABORT_FILE"]   = abort_file       = os_path.join(outdir, "sigil_console.abort")
-    env["PLUGIN_STARTUP_FILE"] = startup_file     = os_path.join(outdir, "sigil_console_startup.py")
-    env["PLUGIN_MAIN_FILE"]    = main_file        = os_path.join(this_plugin_dir, "plugin_main.py")
+    env["PLUGIN_DUMP_FILE"]    = join(outdir, "sigil_console.dump.pkl")
+    env["PLUGIN_ABORT_FILE"]   = abort_file       = join(outdir, "sigil_console.abort")
+    env["PLUGIN_STARTUP_FILE"] = startup_file     = join(outdir, "sigil_console_startup.py")
+    env["PLUGIN_MAIN_FILE"]    = main_file        = join(this_plugin_dir, "plugin_main.py")
     env["PIP_INDEX_URL"]       = pip_index_url    = config["pip_index_url"]
     env["PIP_TRUSTED_HOST"]    = pip_trusted_host = config["pip_trusted_host"]
     env["PYTHONSTARTUP"]       = startup_file
     environ.update(env)
 
-    open(startup_file, "w", encoding="utf-8").write(f"""\
-#!/usr/bin/env python3
-# coding: utf-8
-
-import builtins
-
-__import__("warnings").filterwarnings("ignore", category=DeprecationWarning)
-
-if hasattr(builtins, "PLUGIN_SETTING"):
-    if __name__ != "__init__":
-        # Execution success information
-        print('''
-    🦶🦶🦶 Environment had been loaded, ignoring
-''')
-else:
-    # Changing working directory
-    __import__("os").chdir({outdir!r})
-
-    # Setting os.environ
-    __import__("os").environ.update({env!r})
-
-    # Injecting module paths
-    if {sigil_package_dir!r} not in __import__("sys").path:
-        __import__("sys").path[:0] = [{sigil_package_dir!r}, {this_plugin_dir!r}]
-
-    # Introducing global variables
-    import plugin_help as plugin
-    from plugin_help import editor
-    bc = bk = __import__("bookcontainer").BookContainer(plugin.load_wrapper())
-
-    # Injecting builtins variable: PLUGIN_SETTING
-    from types import MappingProxyType
-    PLUGIN_SETTING = builtins.PLUGIN_SETTING = MappingProxyType({{
-        "config": MappingProxyType({config!r}), 
-        "path": MappingProxyType({paths!r}), 
-        "env": MappingProxyType({env!r}), 
-    }})
-    del MappingProxyType
-
-    # Perform startup scripts
-    if __name__ == "__main__":
-        plugin.function._startup(globals())
-
-    # Callback at exit
-    __import__("atexit").register(plugin.dump_wrapper)
-
-    # Wrapped exit function for idlelib
+    startup_code = _STARTUP_TEMPLATE.substitute(
+        outdir=repr(outdir), 
+        env=repr(env), 
+        sigil_package_dir=repr(sigil_package_dir), 
+        this_plugin_dir=repr(this_plugin_dir), 
+        config=repr(config), 
+        paths=repr(paths), 
+    )
+    # Skip rewriting (and recompiling) the startup file, if it is unchanged
     try:
-        if isinstance(exit, __import__("_sitebuiltins").Quitter):
-            @staticmethod
-            @__import__("functools").wraps(exit)
-            def exit(*args, _exit=exit):
-                plugin.dump_wrapper()
-                _exit()
-            exit = type("", (), {{"__repr__": lambda self: self(), "__call__": exit}})()
-    except (NameError, ImportError):
-        pass
-
-    if __name__ != "__init__":
-        # Execution success information
-        print('''
-    🎉🎉🎉 Environment loaded successfully
-''')
-
-del builtins
-""")
-    print("WARNING:", "Created startup file\n%r\n" %startup_file)
+        with open(startup_file, encoding="utf-8") as f:
+            startup_changed = f.read() != startup_code
+    except OSError:
+        startup_changed = True
+    if startup_changed:
+        with open(startup_file, "w", encoding="utf-8") as f:
+            f.write(startup_code)
+        print("WARNING:", "Created startup file\n%r\n" %startup_file)
+        # Compile the startup file in advance, the child processes (see `plugin_help.run_plugin`) 
+        # will execute the compiled code directly
+        try:
+            __import__("py_compile").compile(startup_file, cfile=startup_file + "c", doraise=True)
+        except Exception:
+            try:
+                __import__("os").remove(startup_file + "c")
+            except OSError:
+                pass
 
     chdir(outdir)
 
@@ -25,9 +25,8 @@ async def acm(yield_=None, /):
 def ensure_cm(
     obj, /, default=undefined
 ) -> ContextManager:
-    for C in type(obj).__mro__:
-        if '__enter__' in C.__dict__:
-            return obj
+    if hasattr(type(obj), '__enter__'):
+        return obj
     if default is undefined:
         default = obj
     return cm(default)
@@ -36,9 +35,8 @@ def ensure_cm(
 def ensure_acm(
     obj, /, default=undefined
 ) -> AsyncContextManager:
-    for C in type(obj).__mro__:
-        if '__aenter__' in C.__dict__:
-            return obj
+    if hasattr(type(obj), '__aenter__'):
+        return obj
     if default is undefined:
         default = obj
     return acm(default)
@@ -20,31 +20,32 @@ __author__  = 'ChenyangGao <https://chenyanggao.github.io/>'
 __version__ = (0, 0, 2)
 
 from abc import ABC, abstractproperty
-from collections import namedtuple
 from enum import Enum
-from typing import cast, Optional, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import cast, Callable, Optional, Sequence, Tuple, Union
 
 
 __all__ = [
     'SET', 'STD_COLORS', 'MAP_NAME_RGBCOLOR', 'MAP_NAME_HEXCOLOR',  
-    'BaseColor', 'Color', 'RGBColor', 'HexColor', 'colored',
+    'BaseColor', 'Color', 'RGBColor', 'HexColor', 'colored', 'colored_bytes', 
 ]
 
 
 FMTSTR = '\x1b[%sm'
 RESET  = '\x1b[0m' # reset all
+_RESET_BYTES = RESET.encode('ascii')
 
 
-class BaseColor(ABC):
+# Set the attributes of the (otherwise immutable) colors while initializing
+_setattr = object.__setattr__
+
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__abstractmethods__:
-            abcmethods = ', '.join(cls.__abstractmethods__)
-            raise TypeError(
-                f"Can't instantiate abstract class {cls.__qualname__} "
-                f"with abstract methods {abcmethods}"
-            )
-        return super().__new__(cls, *args, **kwargs)
+class BaseColor(ABC):
+    '''Base class of the colors, a color is a small immutable record, which 
+    compares equal to (and unpacks, indexes like) the tuple of its fields, 
+    but it is not a `tuple` (i.e. `isinstance(color, tuple)` is False).'''
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
 
     @abstractproperty
     def fgcolor(self):
@@ -54,68 +55,124 @@ class BaseColor(ABC):
     def bgcolor(self):
         return NotImplemented
 
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__qualname__!r} object is immutable')
 
-class Color(BaseColor, namedtuple('Color', 'color')): # 8 bit color = 256 colors
-    'See: https://en.wikipedia.org/wiki/ANSI_escape_code#8-bit'
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__qualname__!r} object is immutable')
 
-    def __new__(cls, color: int):
-        assert 0 <= color < 256, 'color value out of range(256)' # color in range(256)
-        return super().__new__(cls, color)
+    def __iter__(self):
+        for field in self._fields:
+            yield getattr(self, field)
 
-    @property
-    def fgcolor(self):
-        return '38;5;%d' % self
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def _asdict(self) -> dict:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def _replace(self, /, **kwargs):
+        'Return a new color replacing specified fields with new values.'
+        result = type(self)(*(kwargs.pop(field, getattr(self, field)) for field in self._fields))
+        if kwargs:
+            raise ValueError(f'Got unexpected field names: {list(kwargs)!r}')
+        return result
+
+    def __eq__(self, other):
+        if isinstance(other, BaseColor):
+            return type(self) is type(other) and tuple(self) == tuple(other)
+        elif isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return type(self), tuple(self)
+
+    def __repr__(self):
+        args = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f'{type(self).__qualname__}({args})'
 
-    @property
-    def bgcolor(self):
-        return '48;5;%d' % self
 
+class Color(BaseColor): # 8 bit color = 256 colors
+    'See: https://en.wikipedia.org/wiki/ANSI_escape_code#8-bit'
+    __slots__ = ('color', 'fgcolor', 'bgcolor')
+    _fields = ('color',)
+
+    def __init__(self, color: int):
+        assert 0 <= color < 256, 'color value out of range(256)' # color in range(256)
+        _setattr(self, 'color', color)
+        _setattr(self, 'fgcolor', f'38;5;{color:d}')
+        _setattr(self, 'bgcolor', f'48;5;{color:d}')
 
-class RGBColor(BaseColor, namedtuple('RGB', 'red, green, blue')): # 24 bit color = 16777216 colors
+
+class RGBColor(BaseColor): # 24 bit color = 16777216 colors
     'See: https://en.wikipedia.org/wiki/ANSI_escape_code#24-bit'
+    __slots__ = ('red', 'green', 'blue', 'fgcolor', 'bgcolor')
+    _fields = ('red', 'green', 'blue')
 
-    def __new__(cls, red: int = 0, green: int = 0, blue: int = 0):
+    def __init__(self, red: int = 0, green: int = 0, blue: int = 0):
         assert 0 <= red < 256,   'red value out of range(256)'   # red in range(256)
         assert 0 <= green < 256, 'green value out of range(256)' # green in range(256)
         assert 0 <= blue < 256,  'blue value out of range(256)'  # blue in range(256)
-        return super().__new__(cls, red, green, blue)
+        self._init(red, green, blue)
 
-    @property
-    def fgcolor(self):
-        return '38;2;%d;%d;%d' % self
+    def _init(self, red: int, green: int, blue: int):
+        _setattr(self, 'red', red)
+        _setattr(self, 'green', green)
+        _setattr(self, 'blue', blue)
+        _setattr(self, 'fgcolor', f'38;2;{red:d};{green:d};{blue:d}')
+        _setattr(self, 'bgcolor', f'48;2;{red:d};{green:d};{blue:d}')
 
-    @property
-    def bgcolor(self):
-        return '48;2;%d;%d;%d' % self
+    @classmethod
+    def _from_trusted(cls, rgb: int):
+        'Create an instance from a 24-bit integer `rgb`, skipping the checks.'
+        self = object.__new__(cls)
+        self._init(rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF)
+        return self
 
 
-class HexColor(BaseColor, namedtuple('Hex', 'hexcolor')): # 24 bit color = 16777216 colors
-    'See: https://en.wikipedia.org/wiki/ANSI_escape_code#24-bit'
+_HEX_DIGITS = frozenset('0123456789ABCDEFabcdef')
 
-    def __new__(
-        cls, 
-        hexcolor: str, 
-        _match=__import__('re').compile('#[0-9A-Fa-f]{3}|#[0-9A-Fa-f]{6}').fullmatch
-    ):
-        assert _match(hexcolor) is not None, f'invalid `hexcolor`: {hexcolor!r}'
-        return super().__new__(cls, hexcolor)
-
-    @property
-    def rgb_color(self):
-        hexcolor = self.hexcolor
-        if len(hexcolor) == 4:
-            rgb = (int(h*2, 16) for h in hexcolor[1:])
-        else:
-            rgb = (int(hexcolor[i:i+2], 16) for i in range(1, 7, 2))
-        return RGBColor(*rgb)
 
-    @property
-    def fgcolor(self):
-        return self.rgb_color.fgcolor
+def _hex_to_rgb(hexcolor: str) -> RGBColor:
+    h = hexcolor[1:]
+    if len(h) == 3:
+        h = h[0]*2 + h[1]*2 + h[2]*2
+    return RGBColor._from_trusted(int(h, 16))
 
-    @property
-    def bgcolor(self):
-        return self.rgb_color.bgcolor
+
+class HexColor(BaseColor): # 24 bit color = 16777216 colors
+    'See: https://en.wikipedia.org/wiki/ANSI_escape_code#24-bit'
+    __slots__ = ('hexcolor', 'rgb_color', 'fgcolor', 'bgcolor')
+    _fields = ('hexcolor',)
+
+    def __init__(self, hexcolor: str):
+        assert (
+            len(hexcolor) in (4, 7) and hexcolor[0] == '#' 
+            and _HEX_DIGITS.issuperset(hexcolor[1:])
+        ), f'invalid `hexcolor`: {hexcolor!r}'
+        self._init(hexcolor)
+
+    def _init(self, hexcolor: str):
+        # Parse once here, `fgcolor` and `bgcolor` are derived from it
+        rgb_color = _hex_to_rgb(hexcolor)
+        _setattr(self, 'hexcolor', hexcolor)
+        _setattr(self, 'rgb_color', rgb_color)
+        _setattr(self, 'fgcolor', rgb_color.fgcolor)
+        _setattr(self, 'bgcolor', rgb_color.bgcolor)
+
+    @classmethod
+    def _from_trusted(cls, hexcolor: str):
+        'Create an instance from a known-valid `hexcolor`, skipping the check.'
+        self = object.__new__(cls)
+        self._init(hexcolor)
+        return self
 
 
 # See: https://en.wikipedia.org/wiki/ANSI_escape_code#SGR_.28Select_Graphic_Rendition.29_parameters
@@ -195,294 +252,192 @@ STD_COLORS = {
     '+cyan': 96,
     '+white': 97,
 }
+# Final SGR codes (as strings) of the standard colors and the sets, 
+# looked up directly by `_make_color` and `colored`
+_FG_ANSI = {k: str(v) for k, v in STD_COLORS.items()}
+_BG_ANSI = {k: str(v + 10) for k, v in STD_COLORS.items()}
+_SET_ANSI = {k: str(v) for k, v in SET.items()}
 # See: https://www.runoob.com/html/html-colorvalues.html
-MAP_NAME_HEXCOLOR = {
-    'Black': HexColor('#000000'),
-    'Navy': HexColor('#000080'),
-    'DarkBlue': HexColor('#00008B'),
-    'MediumBlue': HexColor('#0000CD'),
-    'Blue': HexColor('#0000FF'),
-    'DarkGreen': HexColor('#006400'),
-    'Green': HexColor('#008000'),
-    'Teal': HexColor('#008080'),
-    'DarkCyan': HexColor('#008B8B'),
-    'DeepSkyBlue': HexColor('#00BFFF'),
-    'DarkTurquoise': HexColor('#00CED1'),
-    'MediumSpringGreen': HexColor('#00FA9A'),
-    'Lime': HexColor('#00FF00'),
-    'SpringGreen': HexColor('#00FF7F'),
-    'Aqua': HexColor('#00FFFF'),
-    'Cyan': HexColor('#00FFFF'),
-    'MidnightBlue': HexColor('#191970'),
-    'DodgerBlue': HexColor('#1E90FF'),
-    'LightSeaGreen': HexColor('#20B2AA'),
-    'ForestGreen': HexColor('#228B22'),
-    'SeaGreen': HexColor('#2E8B57'),
-    'DarkSlateGray': HexColor('#2F4F4F'),
-    'LimeGreen': HexColor('#32CD32'),
-    'MediumSeaGreen': HexColor('#3CB371'),
-    'Turquoise': HexColor('#40E0D0'),
-    'RoyalBlue': HexColor('#4169E1'),
-    'SteelBlue': HexColor('#4682B4'),
-    'DarkSlateBlue': HexColor('#483D8B'),
-    'MediumTurquoise': HexColor('#48D1CC'),
-    'Indigo': HexColor('#4B0082'),
-    'DarkOliveGreen': HexColor('#556B2F'),
-    'CadetBlue': HexColor('#5F9EA0'),
-    'CornflowerBlue': HexColor('#6495ED'),
-    'MediumAquaMarine': HexColor('#66CDAA'),
-    'DimGray': HexColor('#696969'),
-    'SlateBlue': HexColor('#6A5ACD'),
-    'OliveDrab': HexColor('#6B8E23'),
-    'SlateGray': HexColor('#708090'),
-    'LightSlateGray': HexColor('#778899'),
-    'MediumSlateBlue': HexColor('#7B68EE'),
-    'LawnGreen': HexColor('#7CFC00'),
-    'Chartreuse': HexColor('#7FFF00'),
-    'Aquamarine': HexColor('#7FFFD4'),
-    'Maroon': HexColor('#800000'),
-    'Purple': HexColor('#800080'),
-    'Olive': HexColor('#808000'),
-    'Gray': HexColor('#808080'),
-    'SkyBlue': HexColor('#87CEEB'),
-    'LightSkyBlue': HexColor('#87CEFA'),
-    'BlueViolet': HexColor('#8A2BE2'),
-    'DarkRed': HexColor('#8B0000'),
-    'DarkMagenta': HexColor('#8B008B'),
-    'SaddleBrown': HexColor('#8B4513'),
-    'DarkSeaGreen': HexColor('#8FBC8F'),
-    'LightGreen': HexColor('#90EE90'),
-    'MediumPurple': HexColor('#9370DB'),
-    'DarkViolet': HexColor('#9400D3'),
-    'PaleGreen': HexColor('#98FB98'),
-    'DarkOrchid': HexColor('#9932CC'),
-    'YellowGreen': HexColor('#9ACD32'),
-    'Sienna': HexColor('#A0522D'),
-    'Brown': HexColor('#A52A2A'),
-    'DarkGray': HexColor('#A9A9A9'),
-    'LightBlue': HexColor('#ADD8E6'),
-    'GreenYellow': HexColor('#ADFF2F'),
-    'PaleTurquoise': HexColor('#AFEEEE'),
-    'LightSteelBlue': HexColor('#B0C4DE'),
-    'PowderBlue': HexColor('#B0E0E6'),
-    'FireBrick': HexColor('#B22222'),
-    'DarkGoldenRod': HexColor('#B8860B'),
-    'MediumOrchid': HexColor('#BA55D3'),
-    'RosyBrown': HexColor('#BC8F8F'),
-    'DarkKhaki': HexColor('#BDB76B'),
-    'Silver': HexColor('#C0C0C0'),
-    'MediumVioletRed': HexColor('#C71585'),
-    'IndianRed': HexColor('#CD5C5C'),
-    'Peru': HexColor('#CD853F'),
-    'Chocolate': HexColor('#D2691E'),
-    'Tan': HexColor('#D2B48C'),
-    'LightGray': HexColor('#D3D3D3'),
-    'Thistle': HexColor('#D8BFD8'),
-    'Orchid': HexColor('#DA70D6'),
-    'GoldenRod': HexColor('#DAA520'),
-    'PaleVioletRed': HexColor('#DB7093'),
-    'Crimson': HexColor('#DC143C'),
-    'Gainsboro': HexColor('#DCDCDC'),
-    'Plum': HexColor('#DDA0DD'),
-    'BurlyWood': HexColor('#DEB887'),
-    'LightCyan': HexColor('#E0FFFF'),
-    'Lavender': HexColor('#E6E6FA'),
-    'DarkSalmon': HexColor('#E9967A'),
-    'Violet': HexColor('#EE82EE'),
-    'PaleGoldenRod': HexColor('#EEE8AA'),
-    'LightCoral': HexColor('#F08080'),
-    'Khaki': HexColor('#F0E68C'),
-    'AliceBlue': HexColor('#F0F8FF'),
-    'HoneyDew': HexColor('#F0FFF0'),
-    'Azure': HexColor('#F0FFFF'),
-    'SandyBrown': HexColor('#F4A460'),
-    'Wheat': HexColor('#F5DEB3'),
-    'Beige': HexColor('#F5F5DC'),
-    'WhiteSmoke': HexColor('#F5F5F5'),
-    'MintCream': HexColor('#F5FFFA'),
-    'GhostWhite': HexColor('#F8F8FF'),
-    'Salmon': HexColor('#FA8072'),
-    'AntiqueWhite': HexColor('#FAEBD7'),
-    'Linen': HexColor('#FAF0E6'),
-    'LightGoldenRodYellow': HexColor('#FAFAD2'),
-    'OldLace': HexColor('#FDF5E6'),
-    'Red': HexColor('#FF0000'),
-    'Fuchsia': HexColor('#FF00FF'),
-    'Magenta': HexColor('#FF00FF'),
-    'DeepPink': HexColor('#FF1493'),
-    'OrangeRed': HexColor('#FF4500'),
-    'Tomato': HexColor('#FF6347'),
-    'HotPink': HexColor('#FF69B4'),
-    'Coral': HexColor('#FF7F50'),
-    'DarkOrange': HexColor('#FF8C00'),
-    'LightSalmon': HexColor('#FFA07A'),
-    'Orange': HexColor('#FFA500'),
-    'LightPink': HexColor('#FFB6C1'),
-    'Pink': HexColor('#FFC0CB'),
-    'Gold': HexColor('#FFD700'),
-    'PeachPuff': HexColor('#FFDAB9'),
-    'NavajoWhite': HexColor('#FFDEAD'),
-    'Moccasin': HexColor('#FFE4B5'),
-    'Bisque': HexColor('#FFE4C4'),
-    'MistyRose': HexColor('#FFE4E1'),
-    'BlanchedAlmond': HexColor('#FFEBCD'),
-    'PapayaWhip': HexColor('#FFEFD5'),
-    'LavenderBlush': HexColor('#FFF0F5'),
-    'SeaShell': HexColor('#FFF5EE'),
-    'Cornsilk': HexColor('#FFF8DC'),
-    'LemonChiffon': HexColor('#FFFACD'),
-    'FloralWhite': HexColor('#FFFAF0'),
-    'Snow': HexColor('#FFFAFA'),
-    'Yellow': HexColor('#FFFF00'),
-    'LightYellow': HexColor('#FFFFE0'),
-    'Ivory': HexColor('#FFFFF0'),
-    'White': HexColor('#FFFFFF')
+# Mapping of color name to its 24-bit RGB value, `MAP_NAME_HEXCOLOR` and
+# `MAP_NAME_RGBCOLOR` are derived from it on first access
+_NAMED_RGB = {
+    'Black': 0x000000,
+    'Navy': 0x000080,
+    'DarkBlue': 0x00008B,
+    'MediumBlue': 0x0000CD,
+    'Blue': 0x0000FF,
+    'DarkGreen': 0x006400,
+    'Green': 0x008000,
+    'Teal': 0x008080,
+    'DarkCyan': 0x008B8B,
+    'DeepSkyBlue': 0x00BFFF,
+    'DarkTurquoise': 0x00CED1,
+    'MediumSpringGreen': 0x00FA9A,
+    'Lime': 0x00FF00,
+    'SpringGreen': 0x00FF7F,
+    'Aqua': 0x00FFFF,
+    'Cyan': 0x00FFFF,
+    'MidnightBlue': 0x191970,
+    'DodgerBlue': 0x1E90FF,
+    'LightSeaGreen': 0x20B2AA,
+    'ForestGreen': 0x228B22,
+    'SeaGreen': 0x2E8B57,
+    'DarkSlateGray': 0x2F4F4F,
+    'LimeGreen': 0x32CD32,
+    'MediumSeaGreen': 0x3CB371,
+    'Turquoise': 0x40E0D0,
+    'RoyalBlue': 0x4169E1,
+    'SteelBlue': 0x4682B4,
+    'DarkSlateBlue': 0x483D8B,
+    'MediumTurquoise': 0x48D1CC,
+    'Indigo': 0x4B0082,
+    'DarkOliveGreen': 0x556B2F,
+    'CadetBlue': 0x5F9EA0,
+    'CornflowerBlue': 0x6495ED,
+    'MediumAquaMarine': 0x66CDAA,
+    'DimGray': 0x696969,
+    'SlateBlue': 0x6A5ACD,
+    'OliveDrab': 0x6B8E23,
+    'SlateGray': 0x708090,
+    'LightSlateGray': 0x778899,
+    'MediumSlateBlue': 0x7B68EE,
+    'LawnGreen': 0x7CFC00,
+    'Chartreuse': 0x7FFF00,
+    'Aquamarine': 0x7FFFD4,
+    'Maroon': 0x800000,
+    'Purple': 0x800080,
+    'Olive': 0x808000,
+    'Gray': 0x808080,
+    'SkyBlue': 0x87CEEB,
+    'LightSkyBlue': 0x87CEFA,
+    'BlueViolet': 0x8A2BE2,
+    'DarkRed': 0x8B0000,
+    'DarkMagenta': 0x8B008B,
+    'SaddleBrown': 0x8B4513,
+    'DarkSeaGreen': 0x8FBC8F,
+    'LightGreen': 0x90EE90,
+    'MediumPurple': 0x9370DB,
+    'DarkViolet': 0x9400D3,
+    'PaleGreen': 0x98FB98,
+    'DarkOrchid': 0x9932CC,
+    'YellowGreen': 0x9ACD32,
+    'Sienna': 0xA0522D,
+    'Brown': 0xA52A2A,
+    'DarkGray': 0xA9A9A9,
+    'LightBlue': 0xADD8E6,
+    'GreenYellow': 0xADFF2F,
+    'PaleTurquoise': 0xAFEEEE,
+    'LightSteelBlue': 0xB0C4DE,
+    'PowderBlue': 0xB0E0E6,
+    'FireBrick': 0xB22222,
+    'DarkGoldenRod': 0xB8860B,
+    'MediumOrchid': 0xBA55D3,
+    'RosyBrown': 0xBC8F8F,
+    'DarkKhaki': 0xBDB76B,
+    'Silver': 0xC0C0C0,
+    'MediumVioletRed': 0xC71585,
+    'IndianRed': 0xCD5C5C,
+    'Peru': 0xCD853F,
+    'Chocolate': 0xD2691E,
+    'Tan': 0xD2B48C,
+    'LightGray': 0xD3D3D3,
+    'Thistle': 0xD8BFD8,
+    'Orchid': 0xDA70D6,
+    'GoldenRod': 0xDAA520,
+    'PaleVioletRed': 0xDB7093,
+    'Crimson': 0xDC143C,
+    'Gainsboro': 0xDCDCDC,
+    'Plum': 0xDDA0DD,
+    'BurlyWood': 0xDEB887,
+    'LightCyan': 0xE0FFFF,
+    'Lavender': 0xE6E6FA,
+    'DarkSalmon': 0xE9967A,
+    'Violet': 0xEE82EE,
+    'PaleGoldenRod': 0xEEE8AA,
+    'LightCoral': 0xF08080,
+    'Khaki': 0xF0E68C,
+    'AliceBlue': 0xF0F8FF,
+    'HoneyDew': 0xF0FFF0,
+    'Azure': 0xF0FFFF,
+    'SandyBrown': 0xF4A460,
+    'Wheat': 0xF5DEB3,
+    'Beige': 0xF5F5DC,
+    'WhiteSmoke': 0xF5F5F5,
+    'MintCream': 0xF5FFFA,
+    'GhostWhite': 0xF8F8FF,
+    'Salmon': 0xFA8072,
+    'AntiqueWhite': 0xFAEBD7,
+    'Linen': 0xFAF0E6,
+    'LightGoldenRodYellow': 0xFAFAD2,
+    'OldLace': 0xFDF5E6,
+    'Red': 0xFF0000,
+    'Fuchsia': 0xFF00FF,
+    'Magenta': 0xFF00FF,
+    'DeepPink': 0xFF1493,
+    'OrangeRed': 0xFF4500,
+    'Tomato': 0xFF6347,
+    'HotPink': 0xFF69B4,
+    'Coral': 0xFF7F50,
+    'DarkOrange': 0xFF8C00,
+    'LightSalmon': 0xFFA07A,
+    'Orange': 0xFFA500,
+    'LightPink': 0xFFB6C1,
+    'Pink': 0xFFC0CB,
+    'Gold': 0xFFD700,
+    'PeachPuff': 0xFFDAB9,
+    'NavajoWhite': 0xFFDEAD,
+    'Moccasin': 0xFFE4B5,
+    'Bisque': 0xFFE4C4,
+    'MistyRose': 0xFFE4E1,
+    'BlanchedAlmond': 0xFFEBCD,
+    'PapayaWhip': 0xFFEFD5,
+    'LavenderBlush': 0xFFF0F5,
+    'SeaShell': 0xFFF5EE,
+    'Cornsilk': 0xFFF8DC,
+    'LemonChiffon': 0xFFFACD,
+    'FloralWhite': 0xFFFAF0,
+    'Snow': 0xFFFAFA,
+    'Yellow': 0xFFFF00,
+    'LightYellow': 0xFFFFE0,
+    'Ivory': 0xFFFFF0,
+    'White': 0xFFFFFF,
 }
-MAP_NAME_RGBCOLOR = {
-    'Black': RGBColor(red=0, green=0, blue=0),
-    'Navy': RGBColor(red=0, green=0, blue=128),
-    'DarkBlue': RGBColor(red=0, green=0, blue=139),
-    'MediumBlue': RGBColor(red=0, green=0, blue=205),
-    'Blue': RGBColor(red=0, green=0, blue=255),
-    'DarkGreen': RGBColor(red=0, green=100, blue=0),
-    'Green': RGBColor(red=0, green=128, blue=0),
-    'Teal': RGBColor(red=0, green=128, blue=128),
-    'DarkCyan': RGBColor(red=0, green=139, blue=139),
-    'DeepSkyBlue': RGBColor(red=0, green=191, blue=255),
-    'DarkTurquoise': RGBColor(red=0, green=206, blue=209),
-    'MediumSpringGreen': RGBColor(red=0, green=250, blue=154),
-    'Lime': RGBColor(red=0, green=255, blue=0),
-    'SpringGreen': RGBColor(red=0, green=255, blue=127),
-    'Aqua': RGBColor(red=0, green=255, blue=255),
-    'Cyan': RGBColor(red=0, green=255, blue=255),
-    'MidnightBlue': RGBColor(red=25, green=25, blue=112),
-    'DodgerBlue': RGBColor(red=30, green=144, blue=255),
-    'LightSeaGreen': RGBColor(red=32, green=178, blue=170),
-    'ForestGreen': RGBColor(red=34, green=139, blue=34),
-    'SeaGreen': RGBColor(red=46, green=139, blue=87),
-    'DarkSlateGray': RGBColor(red=47, green=79, blue=79),
-    'LimeGreen': RGBColor(red=50, green=205, blue=50),
-    'MediumSeaGreen': RGBColor(red=60, green=179, blue=113),
-    'Turquoise': RGBColor(red=64, green=224, blue=208),
-    'RoyalBlue': RGBColor(red=65, green=105, blue=225),
-    'SteelBlue': RGBColor(red=70, green=130, blue=180),
-    'DarkSlateBlue': RGBColor(red=72, green=61, blue=139),
-    'MediumTurquoise': RGBColor(red=72, green=209, blue=204),
-    'Indigo': RGBColor(red=75, green=0, blue=130),
-    'DarkOliveGreen': RGBColor(red=85, green=107, blue=47),
-    'CadetBlue': RGBColor(red=95, green=158, blue=160),
-    'CornflowerBlue': RGBColor(red=100, green=149, blue=237),
-    'MediumAquaMarine': RGBColor(red=102, green=205, blue=170),
-    'DimGray': RGBColor(red=105, green=105, blue=105),
-    'SlateBlue': RGBColor(red=106, green=90, blue=205),
-    'OliveDrab': RGBColor(red=107, green=142, blue=35),
-    'SlateGray': RGBColor(red=112, green=128, blue=144),
-    'LightSlateGray': RGBColor(red=119, green=136, blue=153),
-    'MediumSlateBlue': RGBColor(red=123, green=104, blue=238),
-    'LawnGreen': RGBColor(red=124, green=252, blue=0),
-    'Chartreuse': RGBColor(red=127, green=255, blue=0),
-    'Aquamarine': RGBColor(red=127, green=255, blue=212),
-    'Maroon': RGBColor(red=128, green=0, blue=0),
-    'Purple': RGBColor(red=128, green=0, blue=128),
-    'Olive': RGBColor(red=128, green=128, blue=0),
-    'Gray': RGBColor(red=128, green=128, blue=128),
-    'SkyBlue': RGBColor(red=135, green=206, blue=235),
-    'LightSkyBlue': RGBColor(red=135, green=206, blue=250),
-    'BlueViolet': RGBColor(red=138, green=43, blue=226),
-    'DarkRed': RGBColor(red=139, green=0, blue=0),
-    'DarkMagenta': RGBColor(red=139, green=0, blue=139),
-    'SaddleBrown': RGBColor(red=139, green=69, blue=19),
-    'DarkSeaGreen': RGBColor(red=143, green=188, blue=143),
-    'LightGreen': RGBColor(red=144, green=238, blue=144),
-    'MediumPurple': RGBColor(red=147, green=112, blue=219),
-    'DarkViolet': RGBColor(red=148, green=0, blue=211),
-    'PaleGreen': RGBColor(red=152, green=251, blue=152),
-    'DarkOrchid': RGBColor(red=153, green=50, blue=204),
-    'YellowGreen': RGBColor(red=154, green=205, blue=50),
-    'Sienna': RGBColor(red=160, green=82, blue=45),
-    'Brown': RGBColor(red=165, green=42, blue=42),
-    'DarkGray': RGBColor(red=169, green=169, blue=169),
-    'LightBlue': RGBColor(red=173, green=216, blue=230),
-    'GreenYellow': RGBColor(red=173, green=255, blue=47),
-    'PaleTurquoise': RGBColor(red=175, green=238, blue=238),
-    'LightSteelBlue': RGBColor(red=176, green=196, blue=222),
-    'PowderBlue': RGBColor(red=176, green=224, blue=230),
-    'FireBrick': RGBColor(red=178, green=34, blue=34),
-    'DarkGoldenRod': RGBColor(red=184, green=134, blue=11),
-    'MediumOrchid': RGBColor(red=186, green=85, blue=211),
-    'RosyBrown': RGBColor(red=188, green=143, blue=143),
-    'DarkKhaki': RGBColor(red=189, green=183, blue=107),
-    'Silver': RGBColor(red=192, green=192, blue=192),
-    'MediumVioletRed': RGBColor(red=199, green=21, blue=133),
-    'IndianRed': RGBColor(red=205, green=92, blue=92),
-    'Peru': RGBColor(red=205, green=133, blue=63),
-    'Chocolate': RGBColor(red=210, green=105, blue=30),
-    'Tan': RGBColor(red=210, green=180, blue=140),
-    'LightGray': RGBColor(red=211, green=211, blue=211),
-    'Thistle': RGBColor(red=216, green=191, blue=216),
-    'Orchid': RGBColor(red=218, green=112, blue=214),
-    'GoldenRod': RGBColor(red=218, green=165, blue=32),
-    'PaleVioletRed': RGBColor(red=219, green=112, blue=147),
-    'Crimson': RGBColor(red=220, green=20, blue=60),
-    'Gainsboro': RGBColor(red=220, green=220, blue=220),
-    'Plum': RGBColor(red=221, green=160, blue=221),
-    'BurlyWood': RGBColor(red=222, green=184, blue=135),
-    'LightCyan': RGBColor(red=224, green=255, blue=255),
-    'Lavender': RGBColor(red=230, green=230, blue=250),
-    'DarkSalmon': RGBColor(red=233, green=150, blue=122),
-    'Violet': RGBColor(red=238, green=130, blue=238),
-    'PaleGoldenRod': RGBColor(red=238, green=232, blue=170),
-    'LightCoral': RGBColor(red=240, green=128, blue=128),
-    'Khaki': RGBColor(red=240, green=230, blue=140),
-    'AliceBlue': RGBColor(red=240, green=248, blue=255),
-    'HoneyDew': RGBColor(red=240, green=255, blue=240),
-    'Azure': RGBColor(red=240, green=255, blue=255),
-    'SandyBrown': RGBColor(red=244, green=164, blue=96),
-    'Wheat': RGBColor(red=245, green=222, blue=179),
-    'Beige': RGBColor(red=245, green=245, blue=220),
-    'WhiteSmoke': RGBColor(red=245, green=245, blue=245),
-    'MintCream': RGBColor(red=245, green=255, blue=250),
-    'GhostWhite': RGBColor(red=248, green=248, blue=255),
-    'Salmon': RGBColor(red=250, green=128, blue=114),
-    'AntiqueWhite': RGBColor(red=250, green=235, blue=215),
-    'Linen': RGBColor(red=250, green=240, blue=230),
-    'LightGoldenRodYellow': RGBColor(red=250, green=250, blue=210),
-    'OldLace': RGBColor(red=253, green=245, blue=230),
-    'Red': RGBColor(red=255, green=0, blue=0),
-    'Fuchsia': RGBColor(red=255, green=0, blue=255),
-    'Magenta': RGBColor(red=255, green=0, blue=255),
-    'DeepPink': RGBColor(red=255, green=20, blue=147),
-    'OrangeRed': RGBColor(red=255, green=69, blue=0),
-    'Tomato': RGBColor(red=255, green=99, blue=71),
-    'HotPink': RGBColor(red=255, green=105, blue=180),
-    'Coral': RGBColor(red=255, green=127, blue=80),
-    'DarkOrange': RGBColor(red=255, green=140, blue=0),
-    'LightSalmon': RGBColor(red=255, green=160, blue=122),
-    'Orange': RGBColor(red=255, green=165, blue=0),
-    'LightPink': RGBColor(red=255, green=182, blue=193),
-    'Pink': RGBColor(red=255, green=192, blue=203),
-    'Gold': RGBColor(red=255, green=215, blue=0),
-    'PeachPuff': RGBColor(red=255, green=218, blue=185),
-    'NavajoWhite': RGBColor(red=255, green=222, blue=173),
-    'Moccasin': RGBColor(red=255, green=228, blue=181),
-    'Bisque': RGBColor(red=255, green=228, blue=196),
-    'MistyRose': RGBColor(red=255, green=228, blue=225),
-    'BlanchedAlmond': RGBColor(red=255, green=235, blue=205),
-    'PapayaWhip': RGBColor(red=255, green=239, blue=213),
-    'LavenderBlush': RGBColor(red=255, green=240, blue=245),
-    'SeaShell': RGBColor(red=255, green=245, blue=238),
-    'Cornsilk': RGBColor(red=255, green=248, blue=220),
-    'LemonChiffon': RGBColor(red=255, green=250, blue=205),
-    'FloralWhite': RGBColor(red=255, green=250, blue=240),
-    'Snow': RGBColor(red=255, green=250, blue=250),
-    'Yellow': RGBColor(red=255, green=255, blue=0),
-    'LightYellow': RGBColor(red=255, green=255, blue=224),
-    'Ivory': RGBColor(red=255, green=255, blue=240),
-    'White': RGBColor(red=255, green=255, blue=255)
+
+
+@lru_cache(None)
+def _map_name_hexcolor() -> dict[str, HexColor]:
+    return {k: HexColor._from_trusted('#%06X' % v) for k, v in _NAMED_RGB.items()}
+
+
+@lru_cache(None)
+def _map_name_rgbcolor() -> dict[str, RGBColor]:
+    return {k: RGBColor._from_trusted(v) for k, v in _NAMED_RGB.items()}
+
+
+# `MAP_NAME_HEXCOLOR` and `MAP_NAME_RGBCOLOR` will not be built until they are 
+# first accessed (PEP 562)
+_LAZY_MAPS = {
+    'MAP_NAME_HEXCOLOR': _map_name_hexcolor, 
+    'MAP_NAME_RGBCOLOR': _map_name_rgbcolor, 
 }
 
 
+def __getattr__(name: str):
+    try:
+        value = _LAZY_MAPS[name]()
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(globals().keys() | _LAZY_MAPS.keys())
+
+
 GroundColorEnum = Enum('GroundColorEnum', 'fg, bg', start=0)
+_GROUND_FG = GroundColorEnum.fg
+_GROUND_BG = GroundColorEnum.bg
 
 def ensure_enum(obj, cls):
     if isinstance(obj, cls):
@@ -494,26 +449,79 @@ def ensure_enum(obj, cls):
     raise TypeError
 
 
+def _resolve_tuple(color: Tuple[int, ...]) -> RGBColor:
+    return RGBColor(*color[:3])
+
+
+def _resolve_str(color: str) -> BaseColor:
+    if color.startswith('#'):
+        return HexColor(color)
+    try:
+        return _map_name_rgbcolor()[color]
+    except KeyError:
+        raise ValueError(f'invalid color {color!r}') from None
+
+
+# Mapping of the type of a color value to the function that turns it into a `BaseColor`
+_COLOR_RESOLVERS: dict[type, Callable[..., BaseColor]] = {
+    int: Color, 
+    tuple: _resolve_tuple, 
+    str: _resolve_str, 
+}
+
+
+def _to_color(color: Union[str, int, Tuple[int, ...], BaseColor]) -> BaseColor:
+    resolve = _COLOR_RESOLVERS.get(type(color))
+    if resolve is None and not isinstance(color, BaseColor):
+        # Subclasses of the resolvable types
+        for type_, resolve in _COLOR_RESOLVERS.items():
+            if isinstance(color, type_):
+                break
+        else:
+            resolve = None
+    if resolve is not None:
+        color = resolve(color)
+    return cast(BaseColor, color)
+
+
+def _make_fg(color: Union[str, int, Tuple[int, ...], BaseColor]) -> str:
+    if isinstance(color, str):
+        code = _FG_ANSI.get(color)
+        if code is not None:
+            return code
+    return _to_color(color).fgcolor
+
+
+def _make_bg(color: Union[str, int, Tuple[int, ...], BaseColor]) -> str:
+    if isinstance(color, str):
+        code = _BG_ANSI.get(color)
+        if code is not None:
+            return code
+    return _to_color(color).bgcolor
+
+
 def _make_color(
     color: Union[str, int, Tuple[int, ...], BaseColor], 
     kind: Union[int, str, GroundColorEnum] = GroundColorEnum.fg, 
-) -> Union[BaseColor, int]:
-    kind = cast(GroundColorEnum, ensure_enum(kind, GroundColorEnum))
-    if not isinstance(color, BaseColor):
-        if isinstance(color, int):
-            color = Color(color)
-        elif isinstance(color, tuple):
-            color = RGBColor(*color[:3])
-        elif isinstance(color, str):
-            if color.startswith('#'):
-                color = HexColor(color)
-            elif color in STD_COLORS:
-                return STD_COLORS[color] + kind.value * 10
-            elif color in MAP_NAME_RGBCOLOR:
-                color = MAP_NAME_RGBCOLOR[color]
-            else:
-                raise ValueError(f'invalid color {color!r}')
-    return color.bgcolor if kind.value else color.fgcolor
+) -> str:
+    if kind is not _GROUND_FG and kind is not _GROUND_BG:
+        kind = cast(GroundColorEnum, ensure_enum(kind, GroundColorEnum))
+    return _make_bg(color) if kind.value else _make_fg(color)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _sgr_prefix(
+    color: Union[str, int, Tuple[int, ...], BaseColor, None], 
+    bgcolor: Union[str, int, Tuple[int, ...], BaseColor, None], 
+    attrs: Tuple, 
+) -> str:
+    attrs_ = []
+    if color is not None:
+        attrs_.append(_make_fg(color))
+    if bgcolor is not None:
+        attrs_.append(_make_bg(bgcolor))
+    attrs_.extend(_SET_ANSI.get(s) or str(s) for s in attrs)
+    return f'\x1b[{";".join(attrs_)}m'
 
 
 def colored(
@@ -533,16 +541,45 @@ def colored(
 
     :return:                colorized text
     """
-    attrs_ = []
-    if color is not None:
-        attrs_.append(_make_color(color))
-    if bgcolor is not None:
-        attrs_.append(_make_color(bgcolor, 'bg'))
-    if attrs is not None:
-        attrs_.extend(SET.get(s, s) for s in attrs)
-    set_fmt = FMTSTR % ';'.join(map(str, attrs_))
-    reset = RESET if reset_at_end else ''
-    return f'{set_fmt}{text}{reset}'
+    set_fmt = _sgr_prefix(color, bgcolor, tuple(attrs) if attrs else ())
+    if reset_at_end:
+        return f'{set_fmt}{text}{RESET}'
+    return f'{set_fmt}{text}'
+
+
+@lru_cache(maxsize=512, typed=True)
+def _sgr_prefix_bytes(
+    color: Union[str, int, Tuple[int, ...], BaseColor, None], 
+    bgcolor: Union[str, int, Tuple[int, ...], BaseColor, None], 
+    attrs: Tuple, 
+) -> bytes:
+    return _sgr_prefix(color, bgcolor, attrs).encode('ascii')
+
+
+def colored_bytes(
+    text: str, 
+    color: Union[str, int, Tuple[int, ...], BaseColor, None] = None, 
+    bgcolor: Union[str, int, Tuple[int, ...], BaseColor, None] = None, 
+    attrs: Optional[Sequence] = None, 
+    reset_at_end: bool = True, 
+    encoding: str = 'utf-8', 
+) -> bytes:
+    """Colorize text, like `colored`, but return bytes, which can be written 
+    to a binary stream (e.g. `sys.stdout.buffer`) directly.
+
+    :param text:            text that is about to be colorized
+    :param color:           foreground color, if any
+    :param bgcolor:         background color, if any
+    :param attrs:           sequence of set and reset, if any
+    :param reset_at_end:    reset all at text end, if True, default True
+    :param encoding:        encoding of the text, default 'utf-8'
+
+    :return:                colorized text as bytes
+    """
+    set_fmt = _sgr_prefix_bytes(color, bgcolor, tuple(attrs) if attrs else ())
+    if reset_at_end:
+        return b''.join((set_fmt, text.encode(encoding), _RESET_BYTES))
+    return set_fmt + text.encode(encoding)
 
 
 # TODO: Provides a special template syntax to make it easier to set colors and effects
@@ -12,7 +12,9 @@ __author__  = "ChenyangGao <https://chenyanggao.github.io/>"
 __version__ = (0, 0, 1)
 
 from functools import update_wrapper
-from typing import Optional
+from importlib import invalidate_caches
+from importlib.util import find_spec
+from typing import Dict, Optional
 
 
 __all__ = [
@@ -105,12 +107,7 @@ def _embed_standard_shell(namespace={}, banner=""):
     return update_wrapper(wrapper, _embed_standard_shell)
 
 
-if __import__("sys").version_info >= (3, 6):
-    odict = dict
-else:
-    from collections import OrderedDict as odict
-
-DEFAULT_PYTHON_SHELLS = odict([
+DEFAULT_PYTHON_SHELLS = dict([
     ("ptipython", _embed_ptipython_shell),
     ("ipython",   _embed_ipython_shell),
     ("ptpython",  _embed_ptpython_shell),
@@ -118,13 +115,46 @@ DEFAULT_PYTHON_SHELLS = odict([
     ("python",    _embed_standard_shell),
 ])
 
-PYTHON_SHELL_REQUIREMENTS = odict([
+PYTHON_SHELL_REQUIREMENTS = dict([
     ("ptipython", ("ptpython", "ipython")),
     ("ipython",   ("ipython",)),
     ("ptpython",  ("ptpython",)),
     ("bpython",   ("bpython",)),
 ])
 
+# Top-level modules that have to be importable for each default shell, 
+# so that probing a shell does not need to import it
+_SHELL_MODULES = {
+    "ptipython": ("ptpython", "IPython"),
+    "ipython":   ("IPython",),
+    "ptpython":  ("ptpython",),
+    "bpython":   ("bpython",),
+    "python":    (),
+}
+
+# Cache of shell name to installed flag, cleared when shells get installed
+_SHELL_INSTALLED: Dict[str, bool] = {}
+
+
+def _is_shell_installed(shell):
+    try:
+        return _SHELL_INSTALLED[shell]
+    except KeyError:
+        pass
+    modules = _SHELL_MODULES.get(shell)
+    if modules is None:
+        # Not a known shell, run its setup code (imports) to find out
+        try:
+            DEFAULT_PYTHON_SHELLS[shell]()
+        except ImportError:
+            installed = False
+        else:
+            installed = True
+    else:
+        installed = all(find_spec(module) is not None for module in modules)
+    _SHELL_INSTALLED[shell] = installed
+    return installed
+
 
 def get_current_shell():
     return __shell__
@@ -134,15 +164,7 @@ def list_shells():
     """List all registered shells, return a dictionary of shell names 
     and Installed flags (True: installed, False: otherwise)
     """
-    shells = {}
-    for k in DEFAULT_PYTHON_SHELLS:
-        try:
-            DEFAULT_PYTHON_SHELLS[k]()
-        except ImportError:
-            shells[k] = False
-        else:
-            shells[k] = True
-    return shells
+    return {k: _is_shell_installed(k) for k in DEFAULT_PYTHON_SHELLS}
 
 
 def get_shell_embed_func(shells=None, shell_embed_mapping=None):
@@ -155,6 +177,12 @@ def get_shell_embed_func(shells=None, shell_embed_mapping=None):
         shell_embed_mapping = DEFAULT_PYTHON_SHELLS.copy()
     for shell in shells:
         if shell in shell_embed_mapping:
+            # Skip the default shells which are not installed, without importing them
+            if (
+                shell_embed_mapping[shell] is DEFAULT_PYTHON_SHELLS.get(shell)
+                and not _is_shell_installed(shell)
+            ):
+                continue
             try:
                 # function test: run all setup code (imports),
                 # but dont fall into the shell
@@ -202,6 +230,8 @@ def start_specific_python_console(namespace=None, banner="", shell=None):
             else:
                 from .pip_tool import pip_install
             pip_install(*PYTHON_SHELL_REQUIREMENTS[shell])
+            invalidate_caches()
+            _SHELL_INSTALLED.clear()
         return start_python_console(namespace, banner, (shell,))
 
 
@@ -210,17 +240,17 @@ if __name__ == "__main__":
 
     from colored import colored # type: ignore
 
+    bold_shells = {sh: colored(sh, attrs=['bold']) for sh in DEFAULT_PYTHON_SHELLS}
     ap = ArgumentParser(
         description='Start Python Interactive REPL Environment. If not specified '
                     '(means all is specified), or more than one is specified, '
                     'tries to use the first available shell in the specified shells, '
                     'in the order of %(shells)s.'
-                    % {'shells' : (' > '.join(colored(sh, attrs=['bold']) 
-                                              for sh in DEFAULT_PYTHON_SHELLS))})
-    for shell in DEFAULT_PYTHON_SHELLS:
+                    % {'shells' : ' > '.join(bold_shells.values())})
+    for shell, bold_shell in bold_shells.items():
         ap.add_argument(
             '--'+shell, action='store_true', dest=shell,
-            help='Tells me to use Interactive REPL Environment: ' + colored(shell, attrs=['bold']))
+            help='Tells me to use Interactive REPL Environment: ' + bold_shell)
 
     args = ap.parse_args()
     shell_ = next((k for k, v in args.__dict__.items() if v), None)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# coding: utf-8
+
+__author__  = 'ChenyangGao <https://chenyanggao.github.io/>'
+__version__ = (0, 0, 1)
+
+from importlib import import_module
+from typing import Optional
+
+from .undefined import undefined
+
+
+__all__ = ['LazyImport', 'lazy_import']
+
+
+class LazyImport:
+    '''A proxy of a module (or an attribute of the module),
+    the module will not be imported until the proxy is first used.'''
+    __slots__ = ('_module', '_attr', '_package', '_target')
+
+    def __init__(
+        self,
+        module: str,
+        attr: Optional[str] = None,
+        /,
+        package: Optional[str] = None,
+    ):
+        self._module = module
+        self._attr = attr
+        self._package = package
+        self._target = undefined
+
+    def __repr__(self):
+        if self._attr is None:
+            return '<%s %r>' % (type(self).__qualname__, self._module)
+        return '<%s %r from %r>' % (type(self).__qualname__, self._attr, self._module)
+
+    def _resolve(self):
+        target = self._target
+        if target is undefined:
+            target = import_module(self._module, self._package)
+            if self._attr is not None:
+                target = getattr(target, self._attr)
+            self._target = target
+        return target
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, /, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+def lazy_import(
+    module: str,
+    attr: Optional[str] = None,
+    /,
+    package: Optional[str] = None,
+) -> LazyImport:
+    '''Return a proxy, that imports `module` (and gets its attribute `attr`,
+    if it is not None) on first use.
+
+    :param module: The name of module, if it is relative, `package` is required.
+    :param attr: The attribute name of the module.
+    :param package: The anchor for resolving the relative module name.
+
+    :return: A `LazyImport` proxy.
+    '''
+    return LazyImport(module, attr, package=package)
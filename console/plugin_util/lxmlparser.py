@@ -11,8 +11,8 @@ from typing import (
 )
 
 from lxml.etree import ( # type: ignore
-    fromstring as xml_fromstring, tostring as _xml_tostring, 
-    _Element, _ElementTree, Element, XPath, 
+    fromstring as _xml_fromstring, tostring as _xml_tostring, 
+    _Element, _ElementTree, Element, XMLParser, XPath, 
 )
 from lxml.html import ( # type: ignore
     fromstring as _html_fromstring, tostring as _html_tostring, 
@@ -30,6 +30,17 @@ def _ensure_bytes(o: Any) -> bytes:
         return bytes(o)
 
 
+def _has_xml_declaration(text: Union[str, bytes]) -> bool:
+    'Check whether the text is a `str` starting with a XML declaration'
+    return isinstance(text, str) and text.lstrip().startswith('<?xml')
+
+
+def _feed_parse(text: str, parser) -> _Element:
+    'Parse the text by feeding it to the parser, and return the root element'
+    parser.feed(text)
+    return parser.close()
+
+
 def make_element(
     tag: str, 
     attrib: Optional[Mapping] = None, 
@@ -112,6 +123,32 @@ def make_html_element(
     return el
 
 
+def xml_fromstring(
+    text: Union[str, bytes], 
+    parser = None, 
+    **kwds, 
+) -> _Element:
+    '''Convert a string to `lxml.etree._Element` object by using 
+    `lxml.etree.fromstring` function.
+
+    Tips: Please read the following documentation(s) for details
+        - lxml.etree.fromstring
+        - lxml.etree.XMLParser
+
+    :params text: A string containing XML data to parse.
+        A `str` with a XML declaration is also accepted, it will be fed to 
+        the parser directly, without being encoded first.
+    :params parser: The parser, if it is None, use the default parser.
+    :params kwds: Keyword arguments will be passed to 
+        `lxml.etree.fromstring` function.
+
+    :return: The root element of the element tree.
+    '''
+    if _has_xml_declaration(text):
+        return _feed_parse(cast(str, text), XMLParser() if parser is None else parser)
+    return _xml_fromstring(text, parser=parser, **kwds)
+
+
 def xml_tostring(
     element: Union[_Element, _ElementTree], 
     encoding: Optional[str] = None, 
@@ -153,8 +190,8 @@ def xml_tostring(
     if to_unicode:
         string = _xml_tostring(roottree, encoding=encoding, method=method, **kwds)
         if method == 'xml':
-            string = '<?xml version="%s" encoding="%s"?>\n' % (
-                docinfo.xml_version or '1.0', encoding,
+            string = '<?xml version="%s" encoding="UTF-8"?>\n' % (
+                docinfo.xml_version or '1.0',
             ) + string
         return string
     else:
@@ -181,6 +218,8 @@ def html_fromstring(
         - lxml.html.HTMLParser
 
     :params text: A string containing HTML / XHTML data to parse.
+        A `str` with a XML declaration is also accepted, it will be fed to 
+        the parser directly, without being encoded first.
     :params parser: `parser` allows reading HTML into a normal XML tree, 
         this argument will be passed to `lxml.html.fromstring` function.
     :params kwds: Keyword arguments will be passed to 
@@ -196,7 +235,10 @@ b'''<html>
     <head/>
     <body/>
 </html>''', parser=parser, **kwds)
-    tree = _html_fromstring(text, parser=parser, **kwds)
+    if _has_xml_declaration(text):
+        tree = _feed_parse(cast(str, text), parser)
+    else:
+        tree = _html_fromstring(text, parser=parser, **kwds)
     # get root element
     for tree in tree.iterancestors(): 
         pass
@@ -268,11 +310,10 @@ def html_tostring(
         return (
             # However, to be honest, if it is an HTML file, 
             # it does not need to have a <?xml ?> header
-            '<?xml version="%(xml_version)s" encoding="%(encoding)s"?>'
+            '<?xml version="%(xml_version)s" encoding="UTF-8"?>'
             '\n%(doctype)s\n%(doc)s'
         ) % {
             'xml_version': docinfo.xml_version or '1.0',
-            'encoding': encoding,
             'doctype': doctype,
             'doc': _html_tostring(root, encoding=encoding, method=method, **kwds),
         }
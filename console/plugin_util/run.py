@@ -5,7 +5,7 @@ __author__  = "ChenyangGao <https://chenyanggao.github.io/>"
 __version__ = (0, 0, 6)
 __all__ = ["run_in_process", "restart_program", "run_file", "run_path", 
            "ctx_run", "run", "ctx_load", "load", "prun", "prun_module", 
-           "pid_exists", "wait_for_pid_finish"]
+           "aprun_module", "pid_exists", "wait_for_pid_finish"]
 
 import errno
 import inspect
@@ -385,6 +385,39 @@ def prun_module(
     )
 
 
+async def aprun_module(
+    module: Optional[str] = None, 
+    args: Sequence[str] = (), 
+    executable: str = executable, 
+    **kwargs, 
+) -> CompletedProcess:
+    """Run a module as a script in a child process asynchronously, 
+    and wait until it is terminated. So that the startups of many 
+    child processes can overlap (e.g., with `asyncio.gather`).
+
+    :param module: The module to be run, if it is None, just run the `executable`.
+    :param args: The command line arguments.
+    :param executable: The python executable.
+    :param kwargs: Keyword arguments passed to `asyncio.create_subprocess_exec`.
+
+    :return: `subprocess.CompletedProcess` object.
+    """
+    from asyncio import create_subprocess_exec
+
+    if module:
+        args = [executable, "-m", module, *args]
+    else:
+        args = [executable, *args]
+    process = await create_subprocess_exec(*args, **kwargs)
+    try:
+        retcode = await process.wait()
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+        raise
+    return CompletedProcess(args, retcode)
+
+
 def pid_exists(pid: int) -> bool:
     """Check whether pid exists in the current process table.
 
@@ -23,5 +23,13 @@ if [ $(uname -s) = 'Darwin' ]; then
     rm -rf ${PROJDIR}/**/._*
 fi
 
+# Ship bytecode, so that the modules need not be compiled on every plugin launch.
+# The .pyc files are only used by the same Python version, so they are only built 
+# by Sigil's bundled Python, set SIGIL_PYTHON to its path to enable this step.
+# The hash-based .pyc files stay valid even if Sigil does not keep the mtimes on unzip.
+if [ -n "$SIGIL_PYTHON" ]; then
+    "$SIGIL_PYTHON" -m compileall -q --invalidation-mode checked-hash "$PROJDIR/$PROJNAME"
+fi
+
 createpack $CURDIR || createpack $HOME || createpack $PROJDIR || echo Cannot create package file
 cd $CURDIR